@@ -0,0 +1,17 @@
+"""Helpers shared by the example test suites."""
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+
+def load_example(module_name: str, path: Path) -> ModuleType:
+    """Import an example module from its file under a unique name.
+
+    Every example ships its own ``main.py``, so importing them by plain name
+    would return whichever was imported first.
+    """
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
@@ -1,63 +1,113 @@
 """Advanced example of using Redoc with templates and custom converters."""
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any
 
-from redoc import Redoc
+import jinja2
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON serialization
+    orjson = None
+
+from redoc.converters.html_converter import HtmlConverter
+from redoc.utils import ensure_dir
+
+# Maximum number of outputs rendered concurrently (same default as marp-cli)
+PARALLEL = int(os.getenv("REDOC_PARALLEL", "5"))
+
+# Buffer size for files written in many small pieces
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=64)
+def _read_template(path_str: str, mtime_ns: int) -> str:
+    """Read a template file, cached until the file changes on disk."""
+    return Path(path_str).read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=32)
+def _get_template(path_str: str, mtime_ns: int) -> jinja2.Template:
+    """Compile a template file, cached until the file changes on disk."""
+    return jinja2.Template(_read_template(path_str, mtime_ns))
+
+
+@lru_cache(maxsize=1)
+def _get_converter() -> HtmlConverter:
+    """Return the HTML converter shared by all examples in this process."""
+    return HtmlConverter()
+
+
+def _write_html(html_path: Path, html: str) -> None:
+    """Save rendered HTML."""
+    html_path.write_bytes(html.encode("utf-8"))
+
+
+def _dump_json(json_path: Path, data: Dict[str, Any]) -> None:
+    """Save report data as JSON."""
+    if orjson is not None:
+        json_path.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        return
+    # json.dump emits many small chunks; a 1 MiB buffer batches them
+    with open(json_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
 
 class AdvancedRedocExample:
     """Advanced example demonstrating Redoc features."""
     
     def __init__(self):
         """Initialize the example."""
-        self.converter = Redoc()
-        self.output_dir = Path("output")
-        self.output_dir.mkdir(exist_ok=True)
+        self.converter = _get_converter()
+        self.output_dir = ensure_dir("output")
     
     def load_template(self, template_name: str) -> str:
         """Load a template from the templates directory."""
         template_path = Path("templates") / template_name
-        return template_path.read_text(encoding="utf-8")
+        return _read_template(str(template_path), template_path.stat().st_mtime_ns)
+    
+    def render_template(self, template_name: str, data: Dict[str, Any]) -> str:
+        """Render a template from the templates directory with data."""
+        template_path = Path("templates") / template_name
+        template = _get_template(str(template_path), template_path.stat().st_mtime_ns)
+        return template.render(**data)
     
     def generate_report(self, data: Dict[str, Any]) -> Dict[str, str]:
         """Generate a report in multiple formats."""
-        # Load the template
-        template = self.load_template("report.html")
-        
         # Add timestamp
-        data["generated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        data["generated_at"] = datetime.now().isoformat(sep=" ", timespec="seconds")
+        
+        # Render the template once; both the HTML file and the PDF use it
+        html = self.render_template("report.html", data)
         
         # Generate outputs
         outputs = {}
         base_name = f"report_{data.get('report_id', '1')}"
         
-        # Generate PDF
-        pdf_path = self.output_dir / f"{base_name}.pdf"
-        self.converter.convert(
-            template,
-            pdf_path,
-            format="html",
-            **data
-        )
-        outputs["pdf"] = str(pdf_path)
-        
-        # Generate HTML
-        html_path = self.output_dir / f"{base_name}.html"
-        self.converter.convert(
-            template,
-            html_path,
-            format="html",
-            **data
-        )
-        outputs["html"] = str(html_path)
+        paths = {
+            "pdf": self.output_dir / f"{base_name}.pdf",
+            "html": self.output_dir / f"{base_name}.html",
+            "json": self.output_dir / f"{base_name}.json",
+        }
         
-        # Save data as JSON
-        json_path = self.output_dir / f"{base_name}.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        outputs["json"] = str(json_path)
+        # The outputs are independent of each other, so write them side by
+        # side instead of one after another
+        with ThreadPoolExecutor(max_workers=max(1, min(len(paths), PARALLEL))) as ex:
+            futures = {
+                "pdf": ex.submit(self.converter.html_string_to_pdf, html, paths["pdf"]),
+                "html": ex.submit(_write_html, paths["html"], html),
+                "json": ex.submit(_dump_json, paths["json"], data),
+            }
+            for key, future in futures.items():
+                future.result()
+                outputs[key] = str(paths[key])
         
         return outputs
 
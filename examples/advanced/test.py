@@ -1,9 +1,32 @@
 """Tests for the advanced example."""
 
 import unittest
+import contextlib
+import io
 import json
+import os
+import runpy
+import sys
 from pathlib import Path
-import subprocess
+
+# Shared test helpers live one level up, next to the examples
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from _testutils import load_example  # noqa: E402
+
+EXAMPLE_DIR = Path(__file__).parent
+
+main = load_example("advanced_example_main", EXAMPLE_DIR / "main.py")
+
+
+@contextlib.contextmanager
+def _in_example_dir():
+    """Run with the example directory as cwd; the example resolves paths from it."""
+    cwd = os.getcwd()
+    os.chdir(EXAMPLE_DIR)
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
 
 class TestAdvancedExample(unittest.TestCase):
     """Test cases for advanced example."""
@@ -16,25 +39,15 @@ class TestAdvancedExample(unittest.TestCase):
 
     def test_main_script_runs(self):
         """Test that the main script runs without errors."""
-        result = subprocess.run(
-            ["python", "main.py"],
-            cwd=Path(__file__).parent,
-            capture_output=True,
-            text=True,
-            check=False
-        )
-        self.assertEqual(result.returncode, 0, 
-                        f"Script failed with error: {result.stderr}")
+        # Execute main.py as a script, in this interpreter
+        with _in_example_dir(), contextlib.redirect_stdout(io.StringIO()):
+            runpy.run_path(str(EXAMPLE_DIR / "main.py"), run_name="__main__")
 
     def test_output_files_created(self):
         """Test that all output files are created."""
-        # Run the main script
-        subprocess.run(
-            ["python", "main.py"],
-            cwd=Path(__file__).parent,
-            capture_output=True,
-            check=True
-        )
+        # Run the example in-process; it resolves paths relative to its directory
+        with _in_example_dir(), contextlib.redirect_stdout(io.StringIO()):
+            main.main()
         
         # Check for expected output files
         expected_files = [
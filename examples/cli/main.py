@@ -5,20 +5,76 @@ A command-line interface demonstrating Redoc's document conversion capabilities.
 """
 
 import argparse
+import glob
 import json
+import os
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON parsing
+    orjson = None
+
 from redoc import Redoc
 
 # Initialize console for rich output
 console = Console()
 
+# Supported formats as (name, extensions, description).
+# This is a simplified example - in a real app, you would get this from the converter
+_FORMATS = (
+    ("PDF", ("pdf",), "Portable Document Format"),
+    ("DOCX", ("docx",), "Microsoft Word Document"),
+    ("HTML", ("html", "htm"), "HyperText Markup Language"),
+    ("Markdown", ("md", "markdown"), "Lightweight Markup Language"),
+    ("Plain Text", ("txt",), "Plain Text File"),
+)
+
+@lru_cache(maxsize=1)
+def _build_formats_table() -> Table:
+    """Build the supported formats table once."""
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Format", style="cyan")
+    table.add_column("Extensions")
+    table.add_column("Description")
+    
+    for name, extensions, description in _FORMATS:
+        table.add_row(name, ", ".join(extensions), description)
+    return table
+
+@lru_cache(maxsize=1)
+def _get_converter() -> Redoc:
+    """Return the Redoc instance shared by all commands."""
+    return Redoc()
+
+def _new_progress() -> Progress:
+    """Create the spinner progress display used by the commands."""
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        transient=True,
+    )
+
+@contextmanager
+def _use_progress(progress: Optional[Progress]) -> Iterator[Progress]:
+    """Yield the shared progress display, or a new one if none is given."""
+    if progress is not None:
+        yield progress
+        return
+    with _new_progress() as progress:
+        yield progress
+
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -26,6 +82,7 @@ def parse_arguments():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""Examples:
   Convert a document:  %(prog)s convert input.html output.pdf
+  Convert many files:  %(prog)s convert "docs/*.html" output/ --format pdf
   Use a template:     %(prog)s template data.json --template template.html -o output.pdf
 """
     )
@@ -35,11 +92,13 @@ def parse_arguments():
     
     # Convert command
     convert_parser = subparsers.add_parser('convert', help='Convert between document formats')
-    convert_parser.add_argument('input', help='Input file path')
-    convert_parser.add_argument('output', help='Output file path')
+    convert_parser.add_argument('input', nargs='+', help='Input file path(s) or glob pattern(s)')
+    convert_parser.add_argument('output', help='Output file path (output directory for multiple inputs or glob patterns)')
     convert_parser.add_argument('--format', help='Output format (default: inferred from output file extension)')
     convert_parser.add_argument('--options', type=json.loads, default={}, 
                               help='Conversion options as JSON string')
+    convert_parser.add_argument('-P', '--parallel', type=int, default=5,
+                              help='Maximum number of files converted concurrently (default: 5)')
     
     # Template command
     template_parser = subparsers.add_parser('template', help='Generate document from template')
@@ -53,11 +112,18 @@ def parse_arguments():
     
     return parser.parse_args()
 
+@lru_cache(maxsize=32)
+def _load_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a JSON file, cached until the file changes on disk."""
+    with open(path_str, 'rb') as f:
+        content = f.read()
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
 def load_template_data(file_path: str) -> Dict[str, Any]:
     """Load template data from a JSON file."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        path = Path(file_path)
+        return _load_cached(str(path), path.stat().st_mtime_ns)
     except json.JSONDecodeError as e:
         console.print(f"[red]Error:[/red] Invalid JSON in {file_path}: {e}")
         sys.exit(1)
@@ -65,40 +131,115 @@ def load_template_data(file_path: str) -> Dict[str, Any]:
         console.print(f"[red]Error loading {file_path}:[/red] {e}")
         sys.exit(1)
 
-def convert_document(args):
+def expand_inputs(patterns: List[str]) -> List[Path]:
+    """Expand glob patterns in the input list, keeping plain paths as given."""
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else []
+        paths.extend(Path(match) for match in matches or [pattern])
+    return paths
+
+def find_missing(paths: List[Path]) -> List[Path]:
+    """Return the paths that do not exist, reading each parent directory once."""
+    by_parent = defaultdict(list)
+    for path in paths:
+        by_parent[path.parent].append(path)
+    
+    missing = []
+    for parent, children in by_parent.items():
+        try:
+            with os.scandir(parent) as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            present = set()
+        missing.extend(path for path in children if path.name not in present)
+    return missing
+
+def is_batch(patterns: List[str], inputs: List[Path], output: str) -> bool:
+    """Return True when the output argument names a directory of results.
+    
+    That is the case for several inputs, for any glob pattern (even one that
+    matches a single file), and for an output that is an existing directory
+    or ends with a path separator.
+    """
+    return (
+        len(inputs) > 1
+        or any(glob.has_magic(pattern) for pattern in patterns)
+        or output.endswith((os.sep, '/'))
+        or Path(output).is_dir()
+    )
+
+def derive_output(input_path: Path, args, batch: bool) -> Path:
+    """Return the output path for an input file."""
+    if not batch:
+        return Path(args.output)
+    return Path(args.output) / f"{input_path.stem}.{args.format}"
+
+def _convert_file(input_path: Path, output_path: Path, output_format: str, options: Dict[str, Any]) -> Path:
+    """Convert a single file with the shared converter."""
+    _get_converter().convert(
+        str(input_path),
+        str(output_path),
+        format=output_format,
+        **options
+    )
+    return output_path
+
+def convert_document(args, progress: Optional[Progress] = None):
     """Handle the convert command."""
-    input_path = Path(args.input)
-    output_path = Path(args.output)
+    inputs = expand_inputs(args.input)
+    batch = is_batch(args.input, inputs, args.output)
     
-    if not input_path.exists():
-        console.print(f"[red]Error:[/red] Input file not found: {input_path}")
+    # Validate every input before starting any conversion
+    missing = find_missing(inputs)
+    if missing:
+        for input_path in missing:
+            console.print(f"[red]Error:[/red] Input file not found: {input_path}")
         sys.exit(1)
     
-    output_format = args.format or output_path.suffix.lstrip('.')
+    if batch and not args.format:
+        console.print("[red]Error:[/red] --format is required when converting into a directory")
+        sys.exit(1)
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        transient=True,
-    ) as progress:
-        task = progress.add_task("Converting document...", total=None)
-        
+    tasks: List[Tuple[Path, Path]] = [
+        (input_path, derive_output(input_path, args, batch)) for input_path in inputs
+    ]
+    if batch:
+        Path(args.output).mkdir(parents=True, exist_ok=True)
+    
+    with _use_progress(progress) as progress:
+        task_ids = []
         try:
-            converter = Redoc()
-            converter.convert(
-                str(input_path),
-                str(output_path),
-                format=output_format,
-                **args.options
-            )
-            progress.stop()
-            console.print(f"[green]✓[/green] Successfully created {output_path}")
+            if not batch:
+                # A single file does not need the executor
+                input_path, output_path = tasks[0]
+                task_ids.append(progress.add_task("Converting document...", total=None))
+                output_format = args.format or output_path.suffix.lstrip('.')
+                _convert_file(input_path, output_path, output_format, args.options)
+            else:
+                workers = max(1, min(args.parallel, len(tasks)))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {}
+                    for input_path, output_path in tasks:
+                        task_id = progress.add_task(f"Converting {input_path.name}...", total=1)
+                        task_ids.append(task_id)
+                        futures[executor.submit(
+                            _convert_file, input_path, output_path, args.format, args.options
+                        )] = task_id
+                    for future in as_completed(futures):
+                        future.result()
+                        progress.update(futures[future], completed=1)
+            for task_id in task_ids:
+                progress.remove_task(task_id)
+            for _, output_path in tasks:
+                console.print(f"[green]✓[/green] Successfully created {output_path}")
         except Exception as e:
-            progress.stop()
+            for task_id in task_ids:
+                progress.remove_task(task_id)
             console.print(f"[red]Error during conversion:[/red] {e}")
             sys.exit(1)
 
-def generate_from_template(args):
+def generate_from_template(args, progress: Optional[Progress] = None):
     """Handle the template command."""
     template_path = Path(args.template)
     output_path = Path(args.output)
@@ -110,68 +251,46 @@ def generate_from_template(args):
     output_format = args.format or output_path.suffix.lstrip('.')
     template_data = load_template_data(args.data_file)
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        transient=True,
-    ) as progress:
+    with _use_progress(progress) as progress:
         task = progress.add_task("Generating document from template...", total=None)
         
         try:
             with open(template_path, 'r', encoding='utf-8') as f:
                 template_content = f.read()
             
-            converter = Redoc()
+            converter = _get_converter()
             converter.convert(
                 template_content,
                 str(output_path),
                 format=output_format,
                 **template_data
             )
-            progress.stop()
+            progress.remove_task(task)
             console.print(f"[green]✓[/green] Successfully created {output_path}")
         except Exception as e:
-            progress.stop()
+            progress.remove_task(task)
             console.print(f"[red]Error during template generation:[/red] {e}")
             sys.exit(1)
 
 def list_formats():
     """List supported formats."""
-    # This is a simplified example - in a real app, you would get this from the converter
-    formats = [
-        {"name": "PDF", "extensions": ["pdf"], "description": "Portable Document Format"},
-        {"name": "DOCX", "extensions": ["docx"], "description": "Microsoft Word Document"},
-        {"name": "HTML", "extensions": ["html", "htm"], "description": "HyperText Markup Language"},
-        {"name": "Markdown", "extensions": ["md", "markdown"], "description": "Lightweight Markup Language"},
-        {"name": "Plain Text", "extensions": ["txt"], "description": "Plain Text File"},
-    ]
-    
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Format", style="cyan")
-    table.add_column("Extensions")
-    table.add_column("Description")
-    
-    for fmt in formats:
-        table.add_row(
-            fmt["name"],
-            ", ".join(fmt["extensions"]),
-            fmt["description"]
-        )
-    
     console.print("\n[bold]Supported Formats:[/bold]")
-    console.print(table)
+    console.print(_build_formats_table())
 
 def main():
     """Main entry point."""
     try:
         args = parse_arguments()
         
-        if args.command == 'convert':
-            convert_document(args)
-        elif args.command == 'template':
-            generate_from_template(args)
-        elif args.command == 'formats':
+        if args.command == 'formats':
             list_formats()
+            return
+        
+        with _new_progress() as progress:
+            if args.command == 'convert':
+                convert_document(args, progress)
+            elif args.command == 'template':
+                generate_from_template(args, progress)
             
     except KeyboardInterrupt:
         console.print("\n[red]Operation cancelled by user.[/red]")
@@ -1,12 +1,26 @@
 """Tests for the CLI example."""
 
+import argparse
+import contextlib
+import io
 import json
 import os
 import subprocess
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
+# Shared test helpers live one level up, next to the examples
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from _testutils import load_example  # noqa: E402
+
+
+cli_main = load_example("cli_example_main", Path(__file__).parent / "main.py")
+convert_document = cli_main.convert_document
+generate_from_template = cli_main.generate_from_template
+list_formats = cli_main.list_formats
+
 
 class TestCLI(unittest.TestCase):
     """Test cases for the CLI example."""
@@ -18,9 +32,6 @@ class TestCLI(unittest.TestCase):
         cls.output_dir = cls.test_dir / "output"
         cls.output_dir.mkdir(exist_ok=True, parents=True)  # Create parent directories if needed
         
-        # Path to the main script
-        cls.script_path = cls.test_dir / "main.py"
-        
         # Test files
         cls.template_path = cls.test_dir / "templates" / "invoice.html"
         cls.data_path = cls.test_dir / "data" / "invoice_data.json"
@@ -38,29 +49,36 @@ class TestCLI(unittest.TestCase):
             if file.is_file():
                 file.unlink()
     
-    def run_command(self, args):
-        """Run a command and return the result."""
-        cmd = [sys.executable, str(self.script_path)] + args
+    def run_in_process(self, func, *args):
+        """Call a CLI handler in-process and return (exit_code, stdout)."""
+        stdout = io.StringIO()
+        exit_code = 0
+        with contextlib.redirect_stdout(stdout):
+            try:
+                func(*args)
+            except SystemExit as e:
+                exit_code = e.code
+        return exit_code, stdout.getvalue()
+    
+    def test_help(self):
+        """Test help command by running the script end to end."""
+        # The child process needs the same import path as the test runner
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
         result = subprocess.run(
-            cmd,
+            [sys.executable, "main.py", "--help"],
             cwd=str(self.test_dir),
+            env=env,
             capture_output=True,
             text=True,
-            check=False
+            check=True
         )
-        return result
-    
-    def test_help(self):
-        """Test help command."""
-        result = self.run_command(["--help"])
-        self.assertEqual(result.returncode, 0)
         self.assertIn("usage:", result.stdout)
     
     def test_formats_command(self):
         """Test formats command."""
-        result = self.run_command(["formats"])
-        self.assertEqual(result.returncode, 0)
-        self.assertIn("Supported Formats", result.stdout)
+        exit_code, stdout = self.run_in_process(list_formats)
+        self.assertEqual(exit_code, 0)
+        self.assertIn("Supported Formats", stdout)
     
     def test_template_command(self):
         """Test template command."""
@@ -70,25 +88,26 @@ class TestCLI(unittest.TestCase):
         # Ensure output directory exists
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        result = self.run_command([
-            "template",
-            str(self.data_path),
-            "--template", str(self.template_path),
-            "-o", str(output_file)
-        ])
+        exit_code, stdout = self.run_in_process(
+            generate_from_template,
+            argparse.Namespace(
+                data_file=str(self.data_path),
+                template=str(self.template_path),
+                output=str(output_file),
+                format=None
+            )
+        )
         
         # Print debug info
-        print(f"Command output: {result.stdout}")
-        if result.stderr:
-            print(f"Command error: {result.stderr}")
+        print(f"Command output: {stdout}")
         
         # Check if the command failed because of missing dependencies
-        if "No module named 'weasyprint'" in result.stderr:
+        if "No module named 'weasyprint'" in stdout:
             self.skipTest("WeasyPrint is required for PDF generation")
         
-        self.assertEqual(result.returncode, 0, 
-                         f"Command failed with return code {result.returncode}")
-        self.assertIn("Successfully created", result.stdout)
+        self.assertEqual(exit_code, 0, 
+                         f"Command failed with return code {exit_code}")
+        self.assertIn("Successfully created", stdout)
         self.assertTrue(output_file.exists(), 
                       f"Output file was not created: {output_file}")
         self.assertGreater(output_file.stat().st_size, 0, 
@@ -115,28 +134,66 @@ class TestCLI(unittest.TestCase):
         # Ensure output directory exists
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        result = self.run_command([
-            "convert",
-            str(html_file),
-            str(output_file)
-        ])
+        exit_code, stdout = self.run_in_process(
+            convert_document,
+            argparse.Namespace(
+                input=[str(html_file)],
+                output=str(output_file),
+                format=None,
+                options={},
+                parallel=5
+            )
+        )
         
         # Print debug info
-        print(f"Command output: {result.stdout}")
-        if result.stderr:
-            print(f"Command error: {result.stderr}")
+        print(f"Command output: {stdout}")
         
         # Check if the command failed because of missing dependencies
-        if "No module named 'weasyprint'" in result.stderr:
+        if "No module named 'weasyprint'" in stdout:
             self.skipTest("WeasyPrint is required for PDF generation")
         
-        self.assertEqual(result.returncode, 0, 
-                         f"Command failed with return code {result.returncode}")
-        self.assertIn("Successfully created", result.stdout)
+        self.assertEqual(exit_code, 0, 
+                         f"Command failed with return code {exit_code}")
+        self.assertIn("Successfully created", stdout)
         self.assertTrue(output_file.exists(), 
                       f"Output file was not created: {output_file}")
         self.assertGreater(output_file.stat().st_size, 0, 
                          f"Output file is empty: {output_file}")
+    
+    def test_expand_inputs(self):
+        """Test that globs are expanded and plain paths are kept as given."""
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ("b.html", "a.html", "c.txt"):
+                Path(tmp, name).touch()
+            pattern = os.path.join(tmp, "*.html")
+            missing = os.path.join(tmp, "missing.html")
+            
+            self.assertEqual(
+                cli_main.expand_inputs([pattern, missing]),
+                [Path(tmp, "a.html"), Path(tmp, "b.html"), Path(missing)]
+            )
+            self.assertEqual(
+                cli_main.expand_inputs([os.path.join(tmp, "*.pdf")]),
+                [Path(tmp, "*.pdf")]
+            )
+    
+    def test_is_batch(self):
+        """Test that batch mode follows the arguments, not the match count."""
+        one = [Path("a.html")]
+        self.assertFalse(cli_main.is_batch(["a.html"], one, "out.pdf"))
+        self.assertTrue(cli_main.is_batch(["*.html"], one, "out"))
+        self.assertTrue(cli_main.is_batch(["a.html", "b.html"], one * 2, "out"))
+        self.assertTrue(cli_main.is_batch(["a.html"], one, "out/"))
+        self.assertTrue(cli_main.is_batch(["a.html"], one, str(self.output_dir)))
+    
+    def test_find_missing(self):
+        """Test that only inputs absent from their directory are reported."""
+        with tempfile.TemporaryDirectory() as tmp:
+            present = Path(tmp, "present.html")
+            present.touch()
+            paths = [present, Path(tmp, "absent.html"), Path(tmp, "nodir", "x.html")]
+            
+            self.assertEqual(cli_main.find_missing(paths), paths[1:])
 
 
 if __name__ == "__main__":
@@ -1,12 +1,41 @@
 """Data models for invoice generation."""
 
 from datetime import date
-from typing import List, Optional
-from pydantic import BaseModel, Field, validator
+from functools import cached_property
+from typing import Iterable, List, Optional, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, ValidationInfo, field_validator
 from enum import Enum
 
+try:
+    import numpy as np
+except ImportError:  # Optional: vectorized totals for large invoices
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # Optional: compiled totals kernel
+    njit = None
+
+# Below this many items the plain loop beats building arrays
+VECTORIZE_MIN_ITEMS = 512
+
+if njit is not None:
+    @njit(cache=True)
+    def _batch_totals(quantity, unit_price, tax_rate):
+        subtotal = 0.0
+        tax_amount = 0.0
+        for i in range(quantity.shape[0]):
+            line = quantity[i] * unit_price[i]
+            subtotal += line
+            tax_amount += line * tax_rate[i]
+        return subtotal, tax_amount
+else:
+    _batch_totals = None
+
 class Address(BaseModel):
     """Address information."""
+    model_config = ConfigDict(frozen=True)
+    
     name: str = Field(..., description="Name of the person or company")
     street: str = Field(..., description="Street address")
     city: str = Field(..., description="City")
@@ -18,26 +47,73 @@ class Address(BaseModel):
 
 class InvoiceItem(BaseModel):
     """Line item in an invoice."""
+    model_config = ConfigDict(frozen=True)
+    
     description: str = Field(..., description="Item description")
     quantity: float = Field(1.0, description="Quantity")
     unit_price: float = Field(..., description="Price per unit")
     tax_rate: float = Field(0.0, description="Tax rate as decimal (e.g., 0.2 for 20%)")
     
-    @property
+    def model_copy(self, *, update=None, deep: bool = False) -> 'InvoiceItem':
+        """Copy the item, dropping cached totals so ``update`` is reflected."""
+        copied = super().model_copy(update=update, deep=deep)
+        for name in ('subtotal', 'tax_amount', 'total'):
+            copied.__dict__.pop(name, None)
+        return copied
+    
+    @cached_property
     def subtotal(self) -> float:
         """Calculate line item subtotal."""
         return self.quantity * self.unit_price
     
-    @property
+    @cached_property
     def tax_amount(self) -> float:
         """Calculate tax amount for this line item."""
         return self.subtotal * self.tax_rate
     
-    @property
+    @cached_property
     def total(self) -> float:
         """Calculate total including tax."""
         return self.subtotal + self.tax_amount
 
+class InvoiceBatch:
+    """Line items stored as parallel float64 arrays for bulk totals.
+    
+    Items are validated as ``InvoiceItem`` models first and only the numeric
+    fields are copied into the arrays. Requires NumPy.
+    """
+    
+    __slots__ = ('quantity', 'unit_price', 'tax_rate')
+    
+    def __init__(self, quantity, unit_price, tax_rate):
+        self.quantity = quantity
+        self.unit_price = unit_price
+        self.tax_rate = tax_rate
+    
+    @classmethod
+    def from_items(cls, items: Iterable[InvoiceItem]) -> 'InvoiceBatch':
+        """Build a batch from validated invoice items."""
+        if np is None:
+            raise ImportError("InvoiceBatch requires numpy")
+        items = items if isinstance(items, list) else list(items)
+        count = len(items)
+        return cls(
+            np.fromiter((item.quantity for item in items), dtype=np.float64, count=count),
+            np.fromiter((item.unit_price for item in items), dtype=np.float64, count=count),
+            np.fromiter((item.tax_rate for item in items), dtype=np.float64, count=count),
+        )
+    
+    def __len__(self) -> int:
+        return len(self.quantity)
+    
+    def totals(self) -> Tuple[float, float]:
+        """Return the subtotal and tax amount over all items."""
+        if _batch_totals is not None:
+            subtotal, tax_amount = _batch_totals(self.quantity, self.unit_price, self.tax_rate)
+            return float(subtotal), float(tax_amount)
+        subtotals = self.quantity * self.unit_price
+        return float(subtotals.sum()), float(np.dot(subtotals, self.tax_rate))
+
 class PaymentMethod(str, Enum):
     """Available payment methods."""
     BANK_TRANSFER = "bank_transfer"
@@ -84,45 +160,92 @@ class InvoiceData(BaseModel):
     # Bank information (optional)
     bank_info: Optional[dict] = Field(None, description="Bank account details")
     
-    class Config:
-        json_encoders = {
-            date: lambda d: d.isoformat(),
-        }
+    # Set whenever items or discount are reassigned
+    _totals_dirty: bool = PrivateAttr(default=True)
+    
+    def __setattr__(self, name, value):
+        if name in ('items', 'discount'):
+            self._totals_dirty = True
+        super().__setattr__(name, value)
+    
+    def model_copy(self, *, update=None, deep: bool = False) -> 'InvoiceData':
+        """Copy the invoice; updated items or discount mark the totals stale."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update and ('items' in update or 'discount' in update):
+            copied._totals_dirty = True
+        return copied
     
-    @validator('due_date')
-    def due_date_must_be_after_issue_date(cls, v, values):
-        if 'issue_date' in values and v < values['issue_date']:
+    @field_validator('due_date')
+    @classmethod
+    def due_date_must_be_after_issue_date(cls, v, info: ValidationInfo):
+        issue_date = info.data.get('issue_date')
+        if issue_date is not None and v < issue_date:
             raise ValueError('Due date must be after issue date')
         return v
     
-    @validator('items')
+    @field_validator('items')
+    @classmethod
     def validate_items(cls, v):
         if not v:
             raise ValueError('At least one invoice item is required')
         return v
     
-    def calculate_totals(self) -> None:
-        """Calculate all invoice totals."""
-        self.subtotal = sum(item.subtotal for item in self.items)
-        self.tax_amount = sum(item.tax_amount for item in self.items)
-        self.total = self.subtotal + self.tax_amount - self.discount
+    def calculate_totals(self, force: bool = False) -> None:
+        """Calculate all invoice totals.
+        
+        Results are reused until ``items`` or ``discount`` is reassigned. Pass
+        ``force=True`` after mutating the items list in place.
+        """
+        if not (force or self._totals_dirty):
+            return
+        if np is not None and len(self.items) >= VECTORIZE_MIN_ITEMS:
+            subtotal, tax_amount = InvoiceBatch.from_items(self.items).totals()
+        else:
+            subtotal = tax_amount = 0.0
+            for item in self.items:
+                line = item.quantity * item.unit_price
+                subtotal += line
+                tax_amount += line * item.tax_rate
+        self.subtotal = subtotal
+        self.tax_amount = tax_amount
+        self.total = subtotal + tax_amount - self.discount
+        self._totals_dirty = False
     
     def to_dict(self) -> dict:
-        """Convert to dictionary with calculated fields."""
+        """Convert to dictionary with calculated fields, omitting unset optional values."""
         self.calculate_totals()
-        return self.dict()
+        return self.model_dump(exclude_none=True)
     
     @classmethod
     def from_dict(cls, data: dict) -> 'InvoiceData':
         """Create from dictionary with validation."""
-        return cls(**data)
+        return cls.model_validate(data)
+    
+    @classmethod
+    def from_validated_dict(cls, data: dict) -> 'InvoiceData':
+        """Create from trusted data without running validation.
+
+        Only use this for payloads that were already validated, such as the
+        output of ``to_dict`` read back from a cache. Untrusted input must go
+        through ``from_dict``.
+        """
+        data = dict(data)
+        for key in ('company', 'client'):
+            if isinstance(data.get(key), dict):
+                data[key] = Address.model_construct(**data[key])
+        if 'items' in data:
+            data['items'] = [
+                InvoiceItem.model_construct(**item) if isinstance(item, dict) else item
+                for item in data['items']
+            ]
+        return cls.model_construct(**data)
     
     def to_json(self, **kwargs) -> str:
         """Convert to JSON string with calculated fields."""
         self.calculate_totals()
-        return self.json(**kwargs)
+        return self.model_dump_json(**kwargs)
     
     @classmethod
-    def from_json(cls, json_str: str) -> 'InvoiceData':
-        """Create from JSON string with validation."""
-        return cls.parse_raw(json_str)
+    def from_json(cls, json_str: Union[str, bytes]) -> 'InvoiceData':
+        """Create from a JSON string or raw bytes with validation."""
+        return cls.model_validate_json(json_str)
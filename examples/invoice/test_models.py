@@ -0,0 +1,98 @@
+"""Tests for the invoice data models."""
+
+import sys
+import unittest
+from datetime import date
+from pathlib import Path
+
+# Shared test helpers live one level up, next to the examples
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from _testutils import load_example  # noqa: E402
+
+
+models = load_example("invoice_example_models", Path(__file__).parent / "models.py")
+
+ADDRESS = {
+    "name": "Acme Ltd",
+    "street": "1 Main St",
+    "city": "Springfield",
+    "postal_code": "12345",
+    "country": "US",
+}
+
+
+def _invoice_dict():
+    return {
+        "invoice_number": "INV-001",
+        "issue_date": date(2024, 1, 1),
+        "due_date": date(2024, 1, 31),
+        "company": ADDRESS,
+        "client": dict(ADDRESS, name="Client Co"),
+        "items": [
+            {"description": "Design", "quantity": 2, "unit_price": 100.0, "tax_rate": 0.2},
+            {"description": "Hosting", "quantity": 1, "unit_price": 50.0},
+        ],
+    }
+
+
+class TestInvoiceData(unittest.TestCase):
+    """Test cases for InvoiceData."""
+
+    def test_from_validated_dict_round_trips_to_dict(self):
+        """Test that trusted data is rebuilt into nested models."""
+        invoice = models.InvoiceData.from_dict(_invoice_dict())
+        data = invoice.to_dict()
+
+        rebuilt = models.InvoiceData.from_validated_dict(data)
+
+        self.assertIsInstance(rebuilt.company, models.Address)
+        self.assertIsInstance(rebuilt.items[0], models.InvoiceItem)
+        self.assertEqual(rebuilt.items[0].total, 240.0)
+        self.assertEqual(rebuilt.to_dict(), data)
+
+    def test_totals_follow_reassigned_items_and_discount(self):
+        """Test that reassigning items or discount recalculates the totals."""
+        invoice = models.InvoiceData.from_dict(_invoice_dict())
+        self.assertEqual(invoice.to_dict()["total"], 290.0)
+
+        invoice.discount = 40.0
+        self.assertEqual(invoice.to_dict()["total"], 250.0)
+
+        invoice.items = invoice.items[:1]
+        self.assertEqual(invoice.to_dict()["total"], 200.0)
+
+    def test_in_place_item_edits_need_force(self):
+        """Test that in-place list edits are only picked up with force=True."""
+        invoice = models.InvoiceData.from_dict(_invoice_dict())
+        invoice.calculate_totals()
+
+        invoice.items.pop()
+        invoice.calculate_totals()
+        self.assertEqual(invoice.total, 290.0)
+
+        invoice.calculate_totals(force=True)
+        self.assertEqual(invoice.total, 240.0)
+
+    def test_item_copy_drops_cached_totals(self):
+        """Test that a copied item computes totals from its updated fields."""
+        item = models.InvoiceItem(description="Design", quantity=2, unit_price=100.0)
+        self.assertEqual(item.total, 200.0)
+
+        copied = item.model_copy(update={"quantity": 3})
+
+        self.assertEqual(copied.total, 300.0)
+        self.assertEqual(item.total, 200.0)
+
+    def test_copy_with_new_items_recalculates_totals(self):
+        """Test that model_copy with new items marks the totals stale."""
+        invoice = models.InvoiceData.from_dict(_invoice_dict())
+        invoice.calculate_totals()
+
+        copied = invoice.model_copy(update={"items": invoice.items[:1]})
+
+        self.assertEqual(copied.to_dict()["total"], 240.0)
+        self.assertEqual(invoice.to_dict()["total"], 290.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,22 +1,41 @@
 """Web example using FastAPI and Redoc."""
 
+import json
 import os
+import shutil
 import uuid
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from fastapi import FastAPI, File, Form, HTTPException, UploadFile, status
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from starlette.concurrency import run_in_threadpool
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON parsing
+    orjson = None
 
 from redoc import Redoc
 
 # Configuration
 DEBUG = os.getenv("REDOC_DEBUG", "0") == "1"
 UPLOAD_DIR = Path(os.getenv("UPLOAD_DIR", "uploads"))
-ALLOWED_EXTENSIONS = {"pdf", "docx", "html", "txt", "md"}
+ALLOWED_EXTENSIONS = frozenset({"pdf", "docx", "html", "txt", "md"})
+UPLOAD_CHUNK_SIZE = 1 << 20
+_MEDIA_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "html": "text/html",
+    "txt": "text/plain",
+    "md": "text/markdown",
+    "json": "application/json",
+    "xml": "application/xml",
+    "epub": "application/epub+zip",
+}
 
 # Ensure upload directory exists
 UPLOAD_DIR.mkdir(exist_ok=True, parents=True)
@@ -60,6 +79,36 @@ class FormatInfo(BaseModel):
     description: str
     extensions: List[str]
 
+# Supported formats, serialized once at import since the list never changes.
+# This is a simplified example - in a real app, you would get this from the converter
+_FORMATS_JSON = TypeAdapter(List[FormatInfo]).dump_json([
+    FormatInfo(
+        name="PDF",
+        description="Portable Document Format",
+        extensions=["pdf"]
+    ),
+    FormatInfo(
+        name="DOCX",
+        description="Microsoft Word Document",
+        extensions=["docx"]
+    ),
+    FormatInfo(
+        name="HTML",
+        description="HyperText Markup Language",
+        extensions=["html", "htm"]
+    ),
+    FormatInfo(
+        name="Markdown",
+        description="Lightweight Markup Language",
+        extensions=["md", "markdown"]
+    ),
+    FormatInfo(
+        name="Plain Text",
+        description="Plain Text File",
+        extensions=["txt"]
+    )
+])
+
 # Helper functions
 def get_file_extension(filename: str) -> str:
     """Get the file extension from a filename."""
@@ -67,7 +116,21 @@ def get_file_extension(filename: str) -> str:
 
 def allowed_file(filename: str) -> bool:
     """Check if the file has an allowed extension."""
-    return '.' in filename and get_file_extension(filename) in ALLOWED_EXTENSIONS
+    return get_file_extension(filename) in ALLOWED_EXTENSIONS
+
+def parse_options(options: str) -> Dict:
+    """Parse conversion options sent as a JSON object string."""
+    if not options:
+        return {}
+    try:
+        parsed = orjson.loads(options) if orjson is not None else json.loads(options)
+    except ValueError:
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+def _copy_upload(source, file_path: Path) -> None:
+    with open(file_path, "wb") as out:
+        shutil.copyfileobj(source, out, UPLOAD_CHUNK_SIZE)
 
 async def save_upload_file(upload_file: UploadFile) -> Path:
     """Save an uploaded file to the upload directory."""
@@ -82,10 +145,10 @@ async def save_upload_file(upload_file: UploadFile) -> Path:
     filename = f"{uuid.uuid4()}.{file_ext}"
     file_path = UPLOAD_DIR / filename
     
-    # Save the file
+    # Stream the file to disk without loading it into memory
     try:
-        contents = await upload_file.read()
-        file_path.write_bytes(contents)
+        await upload_file.seek(0)
+        await run_in_threadpool(_copy_upload, upload_file.file, file_path)
         return file_path
     except Exception as e:
         if file_path.exists():
@@ -129,10 +192,7 @@ async def convert_document(
         ) from e
     
     # Parse options
-    try:
-        options_dict = eval(options) if options else {}
-    except Exception as e:
-        options_dict = {}
+    options_dict = parse_options(options)
     
     # Generate output filename
     output_filename = f"{input_path.stem}.{output_format}"
@@ -150,7 +210,8 @@ async def convert_document(
         # Return the converted file
         return FileResponse(
             output_path,
-            media_type=f"application/{output_format}",
+            stat_result=os.stat(output_path),
+            media_type=_MEDIA_TYPES.get(output_format, "application/octet-stream"),
             filename=output_filename
         )
     except Exception as e:
@@ -160,8 +221,7 @@ async def convert_document(
         ) from e
     finally:
         # Clean up input file
-        if input_path.exists():
-            input_path.unlink()
+        input_path.unlink(missing_ok=True)
         # Clean up output file if it exists and there was an error
         if output_path.exists() and not output_path.is_file():
             output_path.unlink()
@@ -184,7 +244,8 @@ async def generate_from_template(request: TemplateRequest):
         # Return the generated file
         return FileResponse(
             output_path,
-            media_type=f"application/{request.output_format}",
+            stat_result=os.stat(output_path),
+            media_type=_MEDIA_TYPES.get(request.output_format, "application/octet-stream"),
             filename=output_filename
         )
     except Exception as e:
@@ -200,34 +261,7 @@ async def generate_from_template(request: TemplateRequest):
 @app.get("/formats", response_model=List[FormatInfo])
 async def list_formats():
     """List all supported formats and their details."""
-    # This is a simplified example - in a real app, you would get this from the converter
-    return [
-        FormatInfo(
-            name="PDF",
-            description="Portable Document Format",
-            extensions=["pdf"]
-        ),
-        FormatInfo(
-            name="DOCX",
-            description="Microsoft Word Document",
-            extensions=["docx"]
-        ),
-        FormatInfo(
-            name="HTML",
-            description="HyperText Markup Language",
-            extensions=["html", "htm"]
-        ),
-        FormatInfo(
-            name="Markdown",
-            description="Lightweight Markup Language",
-            extensions=["md", "markdown"]
-        ),
-        FormatInfo(
-            name="Plain Text",
-            description="Plain Text File",
-            extensions=["txt"]
-        )
-    ]
+    return Response(content=_FORMATS_JSON, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
@@ -36,6 +36,13 @@ Hello, {{ name }}!
 This is a test template.
 """
 
+def clear_files(directory: Path) -> None:
+    """Remove the regular files directly inside a directory."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                os.unlink(entry.path)
+
 class TestWebApp(unittest.TestCase):
     """Test cases for the web application."""
 
@@ -50,9 +57,7 @@ class TestWebApp(unittest.TestCase):
     def setUp(self):
         """Set up before each test."""
         # Clear upload directory before each test
-        for file in self.upload_dir.glob("*"):
-            if file.is_file():
-                file.unlink()
+        clear_files(self.upload_dir)
 
     def test_root_endpoint(self):
         """Test the root endpoint."""
@@ -93,7 +98,7 @@ class TestWebApp(unittest.TestCase):
         )
         
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.headers["content-type"], "application/txt")
+        self.assertEqual(response.headers["content-type"], "text/plain; charset=utf-8")
         self.assertIn(b"Hello, Tester!", response.content)
 
     def test_formats_endpoint(self):
@@ -110,9 +115,7 @@ class TestWebApp(unittest.TestCase):
     def tearDownClass(cls):
         """Clean up after tests."""
         # Clean up test upload directory
-        for file in cls.upload_dir.glob("*"):
-            if file.is_file():
-                file.unlink()
+        clear_files(cls.upload_dir)
         cls.upload_dir.rmdir()
 
 if __name__ == "__main__":
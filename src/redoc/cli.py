@@ -3,18 +3,56 @@
 import argparse
 import json
 import os
+import re
 import sys
 from pathlib import Path
 from typing import Optional, Dict, Any
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
+try:
+    import orjson
+except ImportError:  # Optional: faster template parsing
+    orjson = None
 
 from redoc import Redoc
 from redoc.exceptions import ConversionError
 
-console = Console()
+# Rich markup tags used in this module, stripped when Rich is not loaded
+_MARKUP_RE = re.compile(
+    r"\[/?(?:bold|red|green|yellow|cyan|blue)"
+    r"(?: (?:bold|red|green|yellow|cyan|blue))*\]"
+)
+
+
+class _LazyConsole:
+    """Console that only imports Rich when output goes to a terminal.
+    
+    Rich and its dependencies are slow to import, which adds up when the CLI
+    is driven from scripts. Non-interactive output is printed as plain text.
+    """
+    
+    def __init__(self):
+        self._rich = None
+    
+    def use_rich(self):
+        """Load Rich and route all further output through it."""
+        if self._rich is None:
+            from rich.console import Console
+            self._rich = Console()
+        return self._rich
+    
+    def print(self, *objects):
+        if self._rich is None and sys.stdout.isatty():
+            self.use_rich()
+        if self._rich is not None:
+            self._rich.print(*objects)
+        else:
+            print(*(
+                _MARKUP_RE.sub("", obj) if isinstance(obj, str) else obj
+                for obj in objects
+            ))
+
+
+console = _LazyConsole()
 
 def parse_args():
     """Parse command line arguments."""
@@ -92,17 +130,30 @@ def convert_file(redoc: Redoc, args):
         console.print(f"[red]Unexpected error: {str(e)}")
         return 1
 
+def _parse_template(raw) -> Any:
+    """Parse template JSON, with orjson when available.
+    
+    orjson rejects some input the standard library accepts, such as integers
+    wider than 64 bits and ``NaN``; those fall back to ``json.loads``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
 def process_template(redoc: Redoc, args):
     """Process document template."""
     try:
         # Check if template is a file or JSON string
         template_path = Path(args.template)
         if template_path.exists():
-            with open(template_path, 'r') as f:
-                template = json.load(f)
+            raw = template_path.read_bytes()
         else:
             # Try to parse as JSON string
-            template = json.loads(args.template)
+            raw = args.template
+        template = _parse_template(raw)
         
         # Determine output format
         output_format = args.format
@@ -127,7 +178,7 @@ def process_template(redoc: Redoc, args):
             console.print("-" * 80 + "\n")
         
         return 0
-    except json.JSONDecodeError:
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
         console.print("[red]Error: Invalid JSON in template")
         return 1
     except Exception as e:
@@ -136,6 +187,10 @@ def process_template(redoc: Redoc, args):
 
 def interactive_mode():
     """Start interactive mode."""
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+    
+    console.use_rich()
     console.print(Panel.fit(
         "[bold blue]Redoc - Interactive Mode\n"
         "Convert documents and process templates interactively\n"
@@ -2,10 +2,8 @@
 
 from typing import Any, Dict, Type, Optional, Union
 from pathlib import Path
-import importlib
-import pkgutil
-import inspect
 import logging
+import sys
 
 from ..exceptions import UnsupportedFormatError, ConversionError
 
@@ -14,6 +12,9 @@ logger = logging.getLogger(__name__)
 # Dictionary to store registered converters
 _CONVERTERS: Dict[str, Type['BaseConverter']] = {}
 
+# Converter instances, created on first use and shared afterwards
+_INSTANCES: Dict[str, 'BaseConverter'] = {}
+
 
 def register_converter(format_name: str):
     """Decorator to register a converter class for a specific format.
@@ -22,7 +23,9 @@ def register_converter(format_name: str):
         format_name: The format name this converter handles (e.g., 'pdf', 'html')
     """
     def decorator(converter_class):
-        _CONVERTERS[format_name.lower()] = converter_class
+        key = sys.intern(format_name.lower())
+        _CONVERTERS[key] = converter_class
+        _INSTANCES.pop(key, None)
         return converter_class
     return decorator
 
@@ -30,6 +33,9 @@ def register_converter(format_name: str):
 def get_converter(format_name: str) -> 'BaseConverter':
     """Get a converter instance for the specified format.
     
+    Instances are created once per format and shared between callers, so
+    converters must not keep per-conversion state on ``self``.
+    
     Args:
         format_name: The format to get a converter for
         
@@ -39,10 +45,17 @@ def get_converter(format_name: str) -> 'BaseConverter':
     Raises:
         UnsupportedFormatError: If no converter is available for the format
     """
-    format_name = format_name.lower()
-    if format_name not in _CONVERTERS:
-        raise UnsupportedFormatError(f"No converter available for format: {format_name}")
-    return _CONVERTERS[format_name]()
+    # Registered names are lowercase, so the common case needs no .lower()
+    converter = _INSTANCES.get(format_name)
+    if converter is None:
+        format_name = format_name.lower()
+        converter = _INSTANCES.get(format_name)
+    if converter is None:
+        converter_class = _CONVERTERS.get(format_name)
+        if converter_class is None:
+            raise UnsupportedFormatError(f"No converter available for format: {format_name}")
+        converter = _INSTANCES.setdefault(format_name, converter_class())
+    return converter
 
 
 class BaseConverter:
@@ -72,3 +85,15 @@ class BaseConverter:
     def get_supported_formats(self) -> list:
         """Get a list of formats this converter can handle."""
         raise NotImplementedError("Subclasses must implement get_supported_formats method")
+
+
+# Built-in converters. Importing each module registers it; the list is
+# explicit so no package scanning happens at startup.
+from . import (  # noqa: E402,F401
+    docx_converter,
+    epub_converter,
+    html_converter,
+    json_converter,
+    pdf_converter,
+    xml_converter,
+)
@@ -1,21 +1,615 @@
 """DOCX converter implementation for Redoc."""
 
+import atexit
+import hashlib
 import json
 import os
+import queue
+import shutil
+import socket
+import subprocess
 import tempfile
+import threading
+import time
+import zipfile
+from contextlib import ExitStack, suppress
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
+try:
+    from lxml import etree
+except ImportError:  # Optional: the stdlib parser handles the same XML
+    import xml.etree.ElementTree as etree
+
+try:
+    from blake3 import blake3
+except ImportError:  # Optional: faster hashing for the output cache
+    blake3 = None
+
+try:
+    from docx import Document
+    from docx.table import _Cell
+except ImportError:  # Optional: python-docx, needed to write DOCX from templates
+    Document = None
+    _Cell = None
+
+try:
+    from htmldocx import HtmlToDocx
+except ImportError:  # Optional: HTML/Markdown to DOCX
+    HtmlToDocx = None
+
+try:
+    from markdown_it import MarkdownIt
+except ImportError:  # Optional: faster Markdown to DOCX
+    MarkdownIt = None
+
+try:
+    import markdown
+except ImportError:  # Optional: Markdown to DOCX when markdown-it-py is missing
+    markdown = None
+
+try:
+    import markdownify
+except ImportError:  # Optional: HTML-based DOCX to Markdown fallback
+    markdownify = None
+
+from .. import __version__
 from . import register_converter, BaseConverter
 from ..exceptions import ConversionError
+from ..utils import ensure_dir
+
+
+# Target formats LibreOffice can write, mapped to its --convert-to filter names
+_LIBREOFFICE_FORMATS = {
+    'pdf': 'pdf',
+    'docx': 'docx',
+    'odt': 'odt',
+    'rtf': 'rtf',
+    'txt': 'txt',
+    'html': 'html',
+}
+
+# Shared Markdown renderer; building a MarkdownIt instance compiles its rules
+_MD_PARSER = MarkdownIt('commonmark').enable('table') if MarkdownIt is not None else None
+
+# Parent for LibreOffice staging directories; tmpfs when the system has one
+_STAGING_ROOT = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# Escapes text for HTML element content in one C-level pass per string
+_HTML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+# Document head and tail shared by every DOCX to HTML conversion
+_HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Converted Document</title>
+<style>
+    body { font-family: Arial, sans-serif; line-height: 1.6; margin: 40px; }
+    h1, h2, h3 { color: #2c3e50; }
+    p { margin: 10px 0; }
+    table { border-collapse: collapse; width: 100%; margin: 20px 0; }
+    th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+    th { background-color: #f2f2f2; }
+    img { max-width: 100%; height: auto; }
+</style>
+</head>
+<body>
+"""
+_HTML_FOOT = "</body>\n</html>\n"
+
+
+def _free_port() -> int:
+    """Return a local TCP port that is free right now."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class LibreOfficePool:
+    """Pool of long-running ``unoserver`` processes.
+    
+    Starting LibreOffice takes seconds, so instead of spawning it for every
+    conversion the pool keeps ``size`` servers warm and hands conversions to
+    them through the ``unoconvert`` client. Each server gets its own ports and
+    user profile so they can run side by side.
+    
+    If a server fails to start, the ones already running are shut down and
+    the pool is marked broken; callers then fall back to one-shot
+    ``libreoffice`` runs.
+    
+    Args:
+        size: Number of servers to start
+        base_port: First port to use, each server taking two consecutive
+            ports; by default free ports are picked at startup
+        startup_timeout: Seconds to wait for each server to accept connections
+    """
+    
+    def __init__(
+        self,
+        size: int,
+        base_port: Optional[int] = None,
+        startup_timeout: float = 30.0
+    ):
+        self.size = size
+        self.base_port = base_port
+        self.startup_timeout = startup_timeout
+        self.broken = False
+        self._ports: 'queue.Queue[int]' = queue.Queue()
+        self._processes: List[subprocess.Popen] = []
+        self._profiles: List[str] = []
+        self._started = False
+        self._lock = threading.Lock()
+    
+    def _server_ports(self) -> List[Tuple[int, int]]:
+        if self.base_port is not None:
+            return [(self.base_port + 2 * i, self.base_port + 2 * i + 1) for i in range(self.size)]
+        return [(_free_port(), _free_port()) for _ in range(self.size)]
+    
+    def _start(self) -> None:
+        with self._lock:
+            if self._started:
+                return
+            if self.broken:
+                raise ConversionError("LibreOffice pool is unavailable")
+            atexit.register(self.close)
+            try:
+                ports = self._server_ports()
+                for port, uno_port in ports:
+                    profile = tempfile.mkdtemp(prefix='redoc_lo_profile_')
+                    self._profiles.append(profile)
+                    self._processes.append(subprocess.Popen(
+                        [
+                            'unoserver',
+                            '--port', str(port),
+                            '--uno-port', str(uno_port),
+                            '--user-installation', Path(profile).as_uri(),
+                        ],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                    ))
+                for port, _ in ports:
+                    self._wait_for_port(port)
+            except Exception as e:
+                self.broken = True
+                self.close()
+                raise ConversionError(f"Failed to start LibreOffice pool: {str(e)}") from e
+            for port, _ in ports:
+                self._ports.put(port)
+            self._started = True
+    
+    def _wait_for_port(self, port: int) -> None:
+        deadline = time.monotonic() + self.startup_timeout
+        while True:
+            try:
+                with socket.create_connection(('127.0.0.1', port), timeout=1):
+                    return
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise ConversionError(f"unoserver on port {port} did not start")
+                time.sleep(0.2)
+    
+    def convert(self, source_path: Path, output_path: Path, target_format: str) -> Path:
+        """Convert a file on the next free server."""
+        self._start()
+        port = self._ports.get()
+        try:
+            subprocess.run(
+                [
+                    'unoconvert', '--port', str(port),
+                    '--convert-to', target_format,
+                    str(source_path), str(output_path),
+                ],
+                check=True, capture_output=True, text=True,
+            )
+        finally:
+            self._ports.put(port)
+        return output_path
+    
+    def close(self) -> None:
+        """Terminate all servers and remove their profiles."""
+        atexit.unregister(self.close)
+        for process in self._processes:
+            process.terminate()
+        for process in self._processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        for profile in self._profiles:
+            shutil.rmtree(profile, ignore_errors=True)
+        self._processes.clear()
+        self._profiles.clear()
+        self._ports = queue.Queue()
+        self._started = False
+
+
+_LO_POOL: Optional[LibreOfficePool] = None
+_LO_POOL_LOCK = threading.Lock()
+
+
+def get_libreoffice_pool() -> Optional[LibreOfficePool]:
+    """Return the shared LibreOffice pool, or None if it is unavailable.
+    
+    The pool size comes from ``REDOC_LO_POOL`` (default: half the CPU cores,
+    at most 4); ``0`` disables it. It is also disabled when the ``unoserver``
+    and ``unoconvert`` commands are not installed, or once it failed to
+    start. ``REDOC_LO_PORT`` pins the first port instead of picking free ones.
+    """
+    global _LO_POOL
+    if _LO_POOL is None:
+        with _LO_POOL_LOCK:
+            if _LO_POOL is None:
+                default_size = min(max(1, (os.cpu_count() or 2) // 2), 4)
+                size = int(os.getenv('REDOC_LO_POOL', default_size))
+                if size <= 0 or not (shutil.which('unoserver') and shutil.which('unoconvert')):
+                    return None
+                base_port = os.getenv('REDOC_LO_PORT')
+                _LO_POOL = LibreOfficePool(size, base_port=int(base_port) if base_port else None)
+    return None if _LO_POOL.broken else _LO_POOL
+
+
+def _convert_on_pool(source_path: Path, output_path: Path, lo_format: str) -> Optional[Path]:
+    """Convert on the unoserver pool; None when the caller should run libreoffice itself."""
+    pool = get_libreoffice_pool()
+    if pool is None:
+        return None
+    try:
+        ensure_dir(output_path.parent)
+        return pool.convert(source_path, output_path, lo_format)
+    except (ConversionError, OSError, subprocess.SubprocessError):
+        return None
+
+
+_PREWARM_STARTED = threading.Event()
+_PREWARM_THREAD: Optional[threading.Thread] = None
+
+
+def _prewarm_libreoffice() -> None:
+    """Start and stop LibreOffice once so its user profile exists.
+    
+    The first headless run for a user creates the profile, which adds
+    seconds to that conversion. Doing it up front hides the cost from the
+    first real request.
+    """
+    with suppress(OSError, subprocess.SubprocessError):
+        subprocess.run(
+            ['libreoffice', '--headless', '--terminate_after_init'],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=120,
+        )
+
+
+def _start_prewarm() -> None:
+    """Prewarm LibreOffice in the background, at most once per process."""
+    global _PREWARM_THREAD
+    if _PREWARM_STARTED.is_set() or os.getenv('REDOC_NO_LO_PREWARM') == '1':
+        return
+    _PREWARM_STARTED.set()
+    if shutil.which('libreoffice') is None:
+        return
+    _PREWARM_THREAD = threading.Thread(
+        target=_prewarm_libreoffice, name='redoc-lo-prewarm', daemon=True
+    )
+    _PREWARM_THREAD.start()
+
+
+def _wait_for_prewarm() -> None:
+    """Block until the prewarm run has exited.
+    
+    A running LibreOffice instance takes over ``--convert-to`` requests made
+    on the same profile and may exit without writing them, so every direct
+    LibreOffice call waits for the prewarm first.
+    """
+    if _PREWARM_THREAD is not None:
+        _PREWARM_THREAD.join()
+
+
+def _disable_prewarm() -> None:
+    """Process pool initializer: workers only render in Python, never prewarm."""
+    _PREWARM_STARTED.set()
+
+
+# Targets rendered in Python from the DOCX XML, as opposed to via LibreOffice
+_PYTHON_TARGETS = frozenset({'html', 'txt', 'md'})
+
+
+def _run_convert_job(job: Dict[str, Any]) -> Any:
+    """Run one ``convert_many`` job; module level so worker processes can pickle it."""
+    return DocxConverter().convert(**job)
+
+
+def _job_target(job: Dict[str, Any]) -> str:
+    if job.get('to_format'):
+        return job['to_format'].lower()
+    output_file = job.get('output_file')
+    return Path(output_file).suffix[1:].lower() if output_file else ''
+
+
+# Salted into every cache key so output cached by another release or an older
+# renderer is never served; bump the number whenever rendered output changes
+_CACHE_VERSION = ('DocxConverter', __version__, 1)
+
+
+def _cache_dir() -> Path:
+    """Directory for cached conversion outputs (``REDOC_CACHE_DIR`` overrides)."""
+    configured = os.getenv('REDOC_CACHE_DIR')
+    if configured:
+        return Path(configured)
+    base = os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'redoc'
+
+
+def _cache_path(source_path: Path, to_format: str, options: Dict[str, Any]) -> Path:
+    """Return the cache location for converting ``source_path`` with ``options``.
+    
+    The key covers the converter version, the source bytes, the target
+    format and the conversion options, so any change to one of them misses
+    the cache.
+    """
+    hasher = blake3() if blake3 is not None else hashlib.blake2b(digest_size=32)
+    with open(source_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            hasher.update(chunk)
+    hasher.update(repr((_CACHE_VERSION, to_format, sorted(options.items(), key=lambda item: item[0]))).encode())
+    return _cache_dir() / f'{hasher.hexdigest()}.{to_format}'
+
+
+def _store_in_cache(output_path: Path, cache_path: Path) -> None:
+    ensure_dir(cache_path.parent)
+    fd, temp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+    os.close(fd)
+    try:
+        shutil.copyfile(output_path, temp_path)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        with suppress(OSError):
+            os.unlink(temp_path)
+
+
+# document.xml parts up to this size are parsed as a whole tree; iterparse's
+# per-event overhead only pays off once memory becomes the concern
+_DOCX_TREE_PARSE_LIMIT = 4 << 20
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_P = _W + 'p'
+_W_TBL = _W + 'tbl'
+_W_TR = _W + 'tr'
+_W_TC = _W + 'tc'
+_W_R = _W + 'r'
+_W_HYPERLINK = _W + 'hyperlink'
+_W_T = _W + 't'
+_W_TAB = _W + 'tab'
+_W_BR = _W + 'br'
+_W_CR = _W + 'cr'
+_W_PPR = _W + 'pPr'
+_W_PSTYLE = _W + 'pStyle'
+_W_OUTLINE_LVL = _W + 'outlineLvl'
+_W_STYLE = _W + 'style'
+_W_STYLE_ID = _W + 'styleId'
+_W_TYPE = _W + 'type'
+_W_NAME = _W + 'name'
+_W_BASED_ON = _W + 'basedOn'
+_W_VAL = _W + 'val'
+_W_NS = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
+
+# With lxml, fetch only the children of the paragraph's own runs (direct or
+# inside hyperlinks) via compiled XPath. Searching all descendants would also
+# pick up tab-stop definitions in w:pPr and textbox content, which Word stores
+# twice (mc:Choice and mc:Fallback).
+_XPATH_RUN_TEXT = (
+    etree.XPath('./w:r/* | ./w:hyperlink/w:r/*', namespaces=_W_NS)
+    if hasattr(etree, 'XPath') else None
+)
+
+
+def _iter_run_content(p) -> Iterator:
+    """Yield the children of the runs of ``p``; ElementTree stand-in for the XPath."""
+    for child in p:
+        if child.tag == _W_R:
+            yield from child
+        elif child.tag == _W_HYPERLINK:
+            for run in child.iterfind(_W_R):
+                yield from run
+
+
+def _paragraph_text(p) -> str:
+    """Return the text of a ``w:p`` element the way python-docx does."""
+    parts = []
+    nodes = _XPATH_RUN_TEXT(p) if _XPATH_RUN_TEXT is not None else _iter_run_content(p)
+    for node in nodes:
+        tag = node.tag
+        if tag == _W_T:
+            if node.text:
+                parts.append(node.text)
+        elif tag == _W_TAB:
+            parts.append('\t')
+        elif tag == _W_BR or tag == _W_CR:
+            parts.append('\n')
+    return ''.join(parts)
+
+
+# Built-in heading style names mapped to HTML heading levels. styles.xml
+# names them in English in every Word language; only the style ids that
+# document.xml refers to are localized ("berschrift1", "Titre1").
+_HEADING_NAMES = {f'heading {i}': min(6, i) for i in range(1, 10)}
+
+# Style ids of the headings for documents without a styles part
+_HEADING_LEVELS = {f'Heading{i}': min(6, i) for i in range(1, 10)}
+
+
+def _outline_level(ppr) -> Optional[int]:
+    """Return the heading level of a ``w:pPr`` outline level, or None."""
+    outline = ppr.find(_W_OUTLINE_LVL)
+    if outline is None:
+        return None
+    try:
+        level = int(outline.get(_W_VAL))
+    except (TypeError, ValueError):
+        return None
+    # Level 9 marks body text
+    return min(6, level + 1) if 0 <= level < 9 else None
+
+
+def _heading_styles(archive: zipfile.ZipFile) -> Dict[str, int]:
+    """Map the paragraph style ids of a DOCX file to HTML heading levels.
+    
+    Levels come from ``word/styles.xml``: the built-in heading name, else the
+    style's outline level, else the level of the style it is based on.
+    """
+    try:
+        root = etree.fromstring(archive.read('word/styles.xml'))
+    except KeyError:
+        return _HEADING_LEVELS
+    
+    levels = {}
+    based_on = {}
+    for style in root.iterfind(_W_STYLE):
+        if style.get(_W_TYPE) != 'paragraph':
+            continue
+        style_id = style.get(_W_STYLE_ID)
+        name = style.find(_W_NAME)
+        level = _HEADING_NAMES.get((name.get(_W_VAL) or '').lower()) if name is not None else None
+        if level is None:
+            ppr = style.find(_W_PPR)
+            level = _outline_level(ppr) if ppr is not None else None
+        if level is not None:
+            levels[style_id] = level
+            continue
+        parent = style.find(_W_BASED_ON)
+        if parent is not None:
+            based_on[style_id] = parent.get(_W_VAL)
+    
+    for style_id, parent in based_on.items():
+        seen = {style_id}
+        while parent is not None and parent not in levels and parent not in seen:
+            seen.add(parent)
+            parent = based_on.get(parent)
+        if parent in levels:
+            levels[style_id] = levels[parent]
+    return levels
+
+
+def _paragraph_level(p, levels: Dict[str, int]) -> Optional[int]:
+    """Return the HTML heading level of a ``w:p`` element, or None for body text."""
+    ppr = p.find(_W_PPR)
+    if ppr is None:
+        return None
+    # A direct outline level overrides the style's
+    if ppr.find(_W_OUTLINE_LVL) is not None:
+        return _outline_level(ppr)
+    style = ppr.find(_W_PSTYLE)
+    return levels.get(style.get(_W_VAL)) if style is not None else None
+
+
+def _table_rows(tbl) -> List[List[str]]:
+    """Return the cell text of a ``w:tbl`` element, row by row."""
+    return [
+        ['\n'.join(_paragraph_text(p) for p in tc.findall(_W_P)) for tc in tr.findall(_W_TC)]
+        for tr in tbl.findall(_W_TR)
+    ]
+
+
+def _walk_blocks(elem, levels: Dict[str, int]) -> Iterator[Tuple]:
+    """Yield the paragraphs and tables under ``elem``, descending into wrappers."""
+    for child in elem:
+        tag = child.tag
+        if tag == _W_P:
+            yield ('p', _paragraph_level(child, levels), _paragraph_text(child))
+        elif tag == _W_TBL:
+            yield ('tbl', _table_rows(child))
+        else:
+            yield from _walk_blocks(child, levels)
+
+
+def _open_docx_xml(archive: zipfile.ZipFile):
+    """Parse ``word/document.xml`` in one go and return its root element."""
+    return etree.fromstring(archive.read('word/document.xml'))
+
+
+def _iter_docx_blocks(source_path: Union[str, Path]) -> Iterator[Tuple]:
+    """Stream the top-level blocks of a DOCX body in document order.
+    
+    Yields ``('p', level, text)`` for paragraphs, where ``level`` is the HTML
+    heading level or None for body text, and ``('tbl', rows)`` for tables,
+    where ``rows`` is a list of lists of cell text. Small documents are
+    parsed in a single call; larger ones are parsed incrementally with each
+    block freed once yielded. Under lxml the freed blocks are also detached
+    from the body, so memory stays flat; ElementTree keeps an empty element
+    per block.
+    """
+    with zipfile.ZipFile(source_path) as archive:
+        levels = _heading_styles(archive)
+        if archive.getinfo('word/document.xml').file_size <= _DOCX_TREE_PARSE_LIMIT:
+            yield from _walk_blocks(_open_docx_xml(archive), levels)
+            return
+        
+        with archive.open('word/document.xml') as xml:
+            # Paragraphs and tables nested in a paragraph belong to textboxes
+            # and are not body blocks, as in _walk_blocks
+            table_depth = 0
+            paragraph_depth = 0
+            # ElementTree elements have no parent links to detach them with
+            detach = hasattr(etree, 'LXML_VERSION')
+            for event, elem in etree.iterparse(xml, events=('start', 'end')):
+                tag = elem.tag
+                if tag == _W_P:
+                    if event == 'start':
+                        paragraph_depth += 1
+                        continue
+                    paragraph_depth -= 1
+                    if paragraph_depth or table_depth:
+                        continue
+                    yield ('p', _paragraph_level(elem, levels), _paragraph_text(elem))
+                elif tag == _W_TBL and not paragraph_depth:
+                    if event == 'start':
+                        table_depth += 1
+                        continue
+                    table_depth -= 1
+                    if table_depth:
+                        continue
+                    yield ('tbl', _table_rows(elem))
+                else:
+                    continue
+                elem.clear()
+                if detach:
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+
+
+def _emit_heading(converter: 'DocxConverter', doc: 'Document', item: Dict[str, Any]) -> None:
+    doc.add_heading(item.get('text', ''), level=item.get('level', 1))
+
+
+def _emit_paragraph(converter: 'DocxConverter', doc: 'Document', item: Dict[str, Any]) -> None:
+    p = doc.add_paragraph()
+    if 'style' in item:
+        p.style = item['style']
+    p.add_run(item.get('text', ''))
+
+
+def _emit_table(converter: 'DocxConverter', doc: 'Document', item: Dict[str, Any]) -> None:
+    converter._add_table(doc, item)
+
+
+# Template content item types mapped to the functions that write them
+_CONTENT_HANDLERS = {
+    'heading': _emit_heading,
+    'paragraph': _emit_paragraph,
+    'table': _emit_table,
+}
 
 
 @register_converter('docx')
 class DocxConverter(BaseConverter):
     """Converter for Microsoft Word (DOCX) documents."""
     
+    SUPPORTED_FORMATS = ('pdf', 'html', 'txt', 'md', 'odt', 'rtf')
+    
     def __init__(self):
-        self.supported_formats = ['pdf', 'html', 'txt', 'md', 'odt', 'rtf']
+        _start_prewarm()
     
     def convert(
         self,
@@ -32,13 +626,14 @@ class DocxConverter(BaseConverter):
                 - from_format: Source format if not inferrable from source
                 - to_format: Target format if not inferrable from output_file
                 - style: Document style for conversion
+                - cache: Reuse a cached output for identical input (default: False)
         """
         try:
             # Handle template input
             if isinstance(source, dict):
                 return self._convert_from_template(source, output_file, **kwargs)
                 
-            source_path = Path(source)
+            source_path = source if isinstance(source, Path) else Path(source)
             
             # If output_file is not specified, determine from source
             if output_file is None:
@@ -47,14 +642,27 @@ class DocxConverter(BaseConverter):
                 to_format = kwargs['to_format']
                 output_file = source_path.with_suffix(f'.{to_format}')
             
-            output_path = Path(output_file)
-            from_format = kwargs.get('from_format', 'docx' if source_path.suffix.lower() == '.docx' else None)
-            to_format = kwargs.get('to_format', output_path.suffix[1:].lower())
+            output_path = output_file if isinstance(output_file, Path) else Path(output_file)
+            from_format = kwargs.get('from_format') or source_path.suffix[1:].lower()
+            to_format = kwargs.get('to_format') or output_path.suffix[1:].lower()
+            
+            # Serve repeated conversions of identical input from the cache
+            cache_path = None
+            if kwargs.pop('cache', False):
+                cache_path = _cache_path(source_path, to_format, kwargs)
+                if cache_path.is_file():
+                    ensure_dir(output_path.parent)
+                    shutil.copyfile(cache_path, output_path)
+                    return output_path
             
             if from_format == 'docx':
-                return self._convert_from_docx(source_path, output_path, to_format, **kwargs)
+                result = self._convert_from_docx(source_path, output_path, to_format, **kwargs)
             else:
-                return self._convert_to_docx(source_path, output_path, from_format, **kwargs)
+                result = self._convert_to_docx(source_path, output_path, from_format, **kwargs)
+            
+            if cache_path is not None and output_path.is_file():
+                _store_in_cache(output_path, cache_path)
+            return result
                 
         except Exception as e:
             raise ConversionError(f"DOCX conversion failed: {str(e)}") from e
@@ -68,35 +676,30 @@ class DocxConverter(BaseConverter):
     ) -> Path:
         """Convert from DOCX to another format."""
         try:
-            from docx import Document
-            
-            # Read the DOCX file
-            doc = Document(source_path)
-            
             if to_format == 'pdf':
                 # Convert DOCX to PDF using unoconv or libreoffice
                 return self._docx_to_pdf(source_path, output_path, **kwargs)
                 
             elif to_format == 'html':
                 # Convert DOCX to HTML
-                html = self._docx_to_html(doc, **kwargs)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
+                html = self._docx_to_html(_iter_docx_blocks(source_path), **kwargs)
+                ensure_dir(output_path.parent)
                 with open(output_path, 'w', encoding='utf-8') as f:
                     f.write(html)
                 return output_path
                 
             elif to_format == 'txt':
                 # Convert DOCX to plain text
-                text = self._docx_to_text(doc)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
+                text = self._docx_to_text(_iter_docx_blocks(source_path))
+                ensure_dir(output_path.parent)
                 with open(output_path, 'w', encoding='utf-8') as f:
                     f.write(text)
                 return output_path
                 
             elif to_format == 'md':
                 # Convert DOCX to Markdown
-                markdown = self._docx_to_markdown(doc, **kwargs)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
+                markdown = self._docx_to_markdown(_iter_docx_blocks(source_path), **kwargs)
+                ensure_dir(output_path.parent)
                 with open(output_path, 'w', encoding='utf-8') as f:
                     f.write(markdown)
                 return output_path
@@ -148,7 +751,13 @@ class DocxConverter(BaseConverter):
     ) -> Path:
         """Convert DOCX to PDF using unoconv or libreoffice."""
         try:
-            # First try unoconv
+            # Prefer a warm LibreOffice server when available
+            produced = _convert_on_pool(source_path, output_path, 'pdf')
+            if produced is not None:
+                return produced
+            
+            # Then try unoconv
+            _wait_for_prewarm()
             try:
                 import unoconv
                 unoconv.convert(str(source_path), output=str(output_path), format='pdf')
@@ -158,20 +767,7 @@ class DocxConverter(BaseConverter):
             
             # Fall back to libreoffice
             try:
-                import subprocess
-                cmd = [
-                    'libreoffice', '--headless', '--convert-to', 'pdf',
-                    '--outdir', str(output_path.parent),
-                    str(source_path)
-                ]
-                subprocess.run(cmd, check=True, capture_output=True, text=True)
-                
-                # Rename the output file if needed
-                pdf_path = source_path.with_suffix('.pdf')
-                if pdf_path != output_path:
-                    pdf_path.replace(output_path)
-                
-                return output_path
+                return self._convert_with_libreoffice(source_path, output_path, 'pdf')
             except Exception as e:
                 raise ConversionError(
                     "Failed to convert DOCX to PDF. "
@@ -183,125 +779,113 @@ class DocxConverter(BaseConverter):
     
     def _docx_to_html(
         self,
-        doc: 'Document',
+        blocks: Iterator[Tuple],
         **kwargs
     ) -> str:
-        """Convert a python-docx Document to HTML."""
-        from bs4 import BeautifulSoup
-        
-        # Create a new BeautifulSoup document
-        soup = BeautifulSoup('', 'html.parser')
-        html = soup.new_tag('html')
-        soup.append(html)
-        
-        # Add head and body
-        head = soup.new_tag('head')
-        html.append(head)
-        
-        title = soup.new_tag('title')
-        title.string = 'Converted Document'
-        head.append(title)
-        
-        # Add basic CSS
-        style = soup.new_tag('style')
-        style.string = """
-            body { font-family: Arial, sans-serif; line-height: 1.6; margin: 40px; }
-            h1, h2, h3 { color: #2c3e50; }
-            p { margin: 10px 0; }
-            table { border-collapse: collapse; width: 100%; margin: 20px 0; }
-            th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
-            th { background-color: #f2f2f2; }
-            img { max-width: 100%; height: auto; }
-        """
-        head.append(style)
-        
-        body = soup.new_tag('body')
-        html.append(body)
-        
-        # Process paragraphs
-        for para in doc.paragraphs:
-            if para.style.name.startswith('Heading'):
-                level = int(para.style.name.lstrip('Heading '))
-                h_tag = soup.new_tag(f'h{min(6, level)}')
-                h_tag.string = para.text
-                body.append(h_tag)
-            else:
-                p = soup.new_tag('p')
-                p.string = para.text
-                body.append(p)
+        """Convert streamed DOCX blocks to HTML."""
+        parts = [_HTML_HEAD]
         
-        # Process tables
-        for table in doc.tables:
-            table_html = soup.new_tag('table')
+        for block in blocks:
+            if block[0] == 'p':
+                _, level, text = block
+                text = text.translate(_HTML_ESCAPE_TABLE)
+                if level is not None:
+                    parts.append(f'<h{level}>{text}</h{level}>\n')
+                else:
+                    parts.append(f'<p>{text}</p>\n')
+                continue
+            
+            rows = block[1]
+            parts.append('<table>\n')
             
             # Add header row if exists
-            if len(table.rows) > 0 and any(cell.text.strip() for cell in table.rows[0].cells):
-                thead = soup.new_tag('thead')
-                tr = soup.new_tag('tr')
-                for cell in table.rows[0].cells:
-                    th = soup.new_tag('th')
-                    th.string = cell.text
-                    tr.append(th)
-                thead.append(tr)
-                table_html.append(thead)
-                    
+            if rows and any(cell.strip() for cell in rows[0]):
+                parts.append(
+                    '<thead><tr><th>'
+                    + '</th><th>'.join(cell.translate(_HTML_ESCAPE_TABLE) for cell in rows[0])
+                    + '</th></tr></thead>\n<tbody>\n'
+                )
+                
                 # Add body rows
-                tbody = soup.new_tag('tbody')
-                for row in table.rows[1:]:
-                        tr = soup.new_tag('tr')
-                        for cell in row.cells:
-                            td = soup.new_tag('td')
-                            td.string = cell.text
-                            tr.append(td)
-                        tbody.append(tr)
-                table_html.append(tbody)
+                for row in rows[1:]:
+                    parts.append(
+                        '<tr><td>'
+                        + '</td><td>'.join(cell.translate(_HTML_ESCAPE_TABLE) for cell in row)
+                        + '</td></tr>\n'
+                    )
+                parts.append('</tbody>\n')
             
-            body.append(table_html)
+            parts.append('</table>\n')
         
-        return soup.prettify()
+        parts.append(_HTML_FOOT)
+        return ''.join(parts)
     
     def _docx_to_text(
         self,
-        doc: 'Document',
+        blocks: Iterator[Tuple],
         **kwargs
     ) -> str:
-        """Convert a python-docx Document to plain text."""
+        """Convert streamed DOCX blocks to plain text."""
         lines = []
         
-        for para in doc.paragraphs:
-            lines.append(para.text)
-        
-        # Add tables as tab-separated values
-        for table in doc.tables:
-            for row in table.rows:
-                row_text = []
-                for cell in row.cells:
-                    row_text.append(cell.text)
-                lines.append('\t'.join(row_text))
-            lines.append('')  # Add empty line after each table
+        for block in blocks:
+            if block[0] == 'p':
+                lines.append(block[2])
+            else:
+                # Add tables as tab-separated values
+                lines.extend('\t'.join(row) for row in block[1])
+                lines.append('')  # Add empty line after each table
         
         return '\n'.join(lines)
     
     def _docx_to_markdown(
         self,
-        doc: 'Document',
+        blocks: Iterator[Tuple],
         **kwargs
     ) -> str:
-        """Convert a python-docx Document to Markdown."""
-        from bs4 import BeautifulSoup
+        """Convert streamed DOCX blocks to Markdown.
+        
+        Markdown is written directly from the blocks. Pass
+        ``html_markdown_fallback=True`` to render HTML and run it through
+        markdownify instead.
+        """
+        if not kwargs.get('html_markdown_fallback'):
+            return self._blocks_to_markdown(blocks)
         
         # First convert to HTML
-        html = self._docx_to_html(doc, **kwargs)
+        html = self._docx_to_html(blocks, **kwargs)
         
         # Then convert HTML to Markdown
-        try:
-            import markdownify
-            return markdownify.markdownify(html, heading_style='ATX')
-        except ImportError:
+        if markdownify is None:
             raise ConversionError(
                 "markdownify package is required for DOCX to Markdown conversion. "
                 "Install with: pip install markdownify"
             )
+        return markdownify.markdownify(html, heading_style='ATX')
+    
+    def _blocks_to_markdown(self, blocks: Iterator[Tuple]) -> str:
+        """Write Markdown straight from streamed DOCX blocks."""
+        parts = []
+        
+        for block in blocks:
+            if block[0] == 'p':
+                _, level, text = block
+                if not text.strip():
+                    continue
+                parts.append(f"{'#' * level} {text}" if level is not None else text)
+                continue
+            
+            rows = block[1]
+            if not rows:
+                continue
+            lines = [
+                '| ' + ' | '.join(cell.replace('|', '\\|').replace('\n', ' ') for cell in row) + ' |'
+                for row in rows
+            ]
+            lines.insert(1, '| ' + ' | '.join('---' for _ in rows[0]) + ' |')
+            parts.append('\n'.join(lines))
+        
+        return '\n\n'.join(parts) + '\n'
     
     def _html_to_docx(
         self,
@@ -310,28 +894,34 @@ class DocxConverter(BaseConverter):
         **kwargs
     ) -> Path:
         """Convert HTML to DOCX."""
+        with open(source_path, 'r', encoding='utf-8') as f:
+            html_content = f.read()
+        return self._html_str_to_docx(html_content, output_path, **kwargs)
+    
+    def _html_str_to_docx(
+        self,
+        html_content: str,
+        output_path: Path,
+        **kwargs
+    ) -> Path:
+        """Convert an HTML string to DOCX."""
+        if HtmlToDocx is None:
+            raise ConversionError(
+                "htmldocx package is required for HTML to DOCX conversion. "
+                "Install with: pip install htmldocx"
+            )
+        
         try:
-            from htmldocx import HtmlToDocx
-            
-            # Read HTML content
-            with open(source_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
             # Convert HTML to DOCX
             docx_converter = HtmlToDocx()
             docx = docx_converter.parse_html_string(html_content)
             
             # Save the document
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            ensure_dir(output_path.parent)
             docx.save(output_path)
             
             return output_path
             
-        except ImportError as e:
-            raise ConversionError(
-                "htmldocx package is required for HTML to DOCX conversion. "
-                "Install with: pip install htmldocx"
-            ) from e
         except Exception as e:
             raise ConversionError(f"Failed to convert HTML to DOCX: {str(e)}") from e
     
@@ -342,42 +932,154 @@ class DocxConverter(BaseConverter):
         **kwargs
     ) -> Path:
         """Convert Markdown to DOCX."""
+        if _MD_PARSER is None and markdown is None:
+            raise ConversionError(
+                "markdown-it-py or markdown package is required for Markdown to DOCX conversion. "
+                "Install with: pip install markdown-it-py"
+            )
+        
         try:
-            import markdown
-            from bs4 import BeautifulSoup
-            
             # Read Markdown content
             with open(source_path, 'r', encoding='utf-8') as f:
                 md_content = f.read()
             
-            # Convert Markdown to HTML
-            html = markdown.markdown(md_content)
-            
-            # Save HTML to a temporary file
-            with tempfile.NamedTemporaryFile(suffix='.html', delete=False, mode='w', encoding='utf-8') as f:
-                f.write(html)
-                temp_html_path = f.name
-            
-            try:
-                # Convert HTML to DOCX
-                self._html_to_docx(Path(temp_html_path), output_path, **kwargs)
-            finally:
-                # Clean up temporary file
-                try:
-                    os.unlink(temp_html_path)
-                except:
-                    pass
-            
-            return output_path
+            # Convert Markdown to HTML and hand it over in memory
+            if _MD_PARSER is not None:
+                html = _MD_PARSER.render(md_content)
+            else:
+                html = markdown.markdown(md_content)
+            return self._html_str_to_docx(html, output_path, **kwargs)
             
-        except ImportError as e:
-            raise ConversionError(
-                "markdown package is required for Markdown to DOCX conversion. "
-                "Install with: pip install markdown"
-            ) from e
+        except ConversionError:
+            raise
         except Exception as e:
             raise ConversionError(f"Failed to convert Markdown to DOCX: {str(e)}") from e
     
+    def convert_many(
+        self,
+        jobs: List[Dict[str, Any]],
+        max_workers: Optional[int] = None
+    ) -> List[Any]:
+        """Run several independent conversions concurrently.
+        
+        Jobs that render HTML, text or Markdown in Python go to a process
+        pool; jobs delegated to LibreOffice go to a thread pool, since they
+        spend their time waiting on a subprocess. Without the unoserver pool,
+        LibreOffice jobs run one at a time: concurrent ``soffice`` processes
+        on the same user profile conflict with each other.
+        
+        Args:
+            jobs: Keyword arguments for ``convert``, one dict per conversion
+            max_workers: Worker count for the process pool (default: CPU count)
+            
+        Returns:
+            Conversion results, in the same order as ``jobs``
+        """
+        results: List[Any] = [None] * len(jobs)
+        cpu_jobs = [i for i, job in enumerate(jobs) if _job_target(job) in _PYTHON_TARGETS]
+        cpu_set = set(cpu_jobs)
+        io_jobs = [i for i in range(len(jobs)) if i not in cpu_set]
+        workers = max_workers or os.cpu_count() or 1
+        
+        with ExitStack() as stack:
+            batches = []
+            if cpu_jobs:
+                processes = stack.enter_context(ProcessPoolExecutor(
+                    max_workers=workers, initializer=_disable_prewarm
+                ))
+                chunksize = max(1, len(cpu_jobs) // (4 * workers))
+                batches.append((cpu_jobs, processes.map(
+                    _run_convert_job, [jobs[i] for i in cpu_jobs], chunksize=chunksize
+                )))
+            if io_jobs:
+                lo_pool = get_libreoffice_pool()
+                threads = stack.enter_context(ThreadPoolExecutor(
+                    max_workers=min(workers, lo_pool.size) if lo_pool is not None else 1
+                ))
+                batches.append((io_jobs, threads.map(_run_convert_job, [jobs[i] for i in io_jobs])))
+            for indices, batch_results in batches:
+                for i, result in zip(indices, batch_results):
+                    results[i] = result
+        return results
+    
+    def convert_batch(
+        self,
+        sources: List[Union[str, Path]],
+        output_dir: Union[str, Path],
+        target_format: str
+    ) -> List[Path]:
+        """Convert several files with LibreOffice in one go.
+        
+        All sources are passed to a single ``libreoffice`` invocation so its
+        startup cost is paid once per batch instead of once per file. When
+        the unoserver pool is available the files are spread across it.
+        
+        Args:
+            sources: Files to convert
+            output_dir: Directory to write the converted files to
+            target_format: Target format (pdf, docx, odt, rtf, txt, html)
+            
+        Returns:
+            Output paths, in the same order as ``sources``
+        """
+        if target_format not in _LIBREOFFICE_FORMATS:
+            raise ConversionError(f"Unsupported target format for libreoffice conversion: {target_format}")
+        
+        lo_format = _LIBREOFFICE_FORMATS[target_format]
+        output_dir = Path(output_dir)
+        source_paths = [Path(source) for source in sources]
+        output_paths = [output_dir / f'{path.stem}.{target_format}' for path in source_paths]
+        if len(set(output_paths)) != len(output_paths):
+            raise ConversionError("Batch sources must have distinct file names")
+        
+        ensure_dir(output_dir)
+        
+        pool = get_libreoffice_pool()
+        if pool is not None:
+            with ThreadPoolExecutor(max_workers=pool.size) as executor:
+                produced = list(executor.map(
+                    lambda paths: _convert_on_pool(paths[0], paths[1], lo_format),
+                    zip(source_paths, output_paths)
+                ))
+            # Whatever the pool could not convert goes through libreoffice below
+            pending = [i for i, path in enumerate(produced) if path is None]
+        else:
+            pending = list(range(len(source_paths)))
+        if not pending:
+            return output_paths
+        
+        self._run_libreoffice(
+            [(source_paths[i], output_paths[i]) for i in pending], target_format
+        )
+        return output_paths
+    
+    def _run_libreoffice(self, jobs: List[Tuple[Path, Path]], target_format: str) -> None:
+        """Convert ``(source, destination)`` pairs in a single libreoffice run.
+        
+        LibreOffice writes many small files while converting; let it do so in
+        a local (RAM-backed where available) directory, then move each result
+        straight to its destination. Sources must have distinct stems.
+        """
+        _wait_for_prewarm()
+        staging_dir = tempfile.mkdtemp(prefix='redoc_lo_', dir=_STAGING_ROOT)
+        try:
+            cmd = [
+                'libreoffice', '--headless', '--convert-to', _LIBREOFFICE_FORMATS[target_format],
+                '--outdir', staging_dir,
+                *(str(source) for source, _ in jobs)
+            ]
+            try:
+                subprocess.run(cmd, check=True, capture_output=True, text=True)
+            except subprocess.CalledProcessError as e:
+                raise ConversionError(
+                    f"libreoffice conversion failed with return code {e.returncode}: {e.stderr}"
+                ) from e
+            for source, destination in jobs:
+                ensure_dir(destination.parent)
+                shutil.move(os.path.join(staging_dir, f'{source.stem}.{target_format}'), destination)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+    
     def _convert_with_libreoffice(
         self,
         source_path: Path,
@@ -387,42 +1089,21 @@ class DocxConverter(BaseConverter):
     ) -> Path:
         """Convert between formats using libreoffice."""
         try:
-            import subprocess
-            
-            # Map target format to libreoffice format
-            format_map = {
-                'pdf': 'pdf',
-                'docx': 'docx',
-                'odt': 'odt',
-                'rtf': 'rtf',
-                'txt': 'txt',
-                'html': 'html',
-            }
-            
-            if target_format not in format_map:
-                raise ConversionError(f"Unsupported target format for libreoffice conversion: {target_format}")
-            
-            # Create output directory if it doesn't exist
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Run libreoffice for conversion
-            cmd = [
-                'libreoffice', '--headless', '--convert-to', format_map[target_format],
-                '--outdir', str(output_path.parent),
-                str(source_path)
-            ]
-            
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-            
-            # Rename the output file if needed
-            output_ext = f'.{target_format}'
-            default_output = source_path.with_suffix(output_ext)
+            if target_format not in _LIBREOFFICE_FORMATS:
+                raise ConversionError(
+                    f"Unsupported target format for libreoffice conversion: {target_format}"
+                )
             
-            if default_output != output_path:
-                default_output.replace(output_path)
+            # Hand the file to a warm server if the pool is available
+            produced = _convert_on_pool(source_path, output_path, _LIBREOFFICE_FORMATS[target_format])
+            if produced is not None:
+                return produced
             
+            self._run_libreoffice([(source_path, output_path)], target_format)
             return output_path
             
+        except ConversionError:
+            raise
         except subprocess.CalledProcessError as e:
             raise ConversionError(
                 f"libreoffice conversion failed with return code {e.returncode}: {e.stderr}"
@@ -437,11 +1118,13 @@ class DocxConverter(BaseConverter):
         **kwargs
     ) -> Path:
         """Convert a template to DOCX."""
+        if Document is None:
+            raise ConversionError(
+                "python-docx package is required for template conversion. "
+                "Install with: pip install python-docx"
+            )
+        
         try:
-            from docx import Document
-            from docx.shared import Pt, Inches
-            from docx.enum.text import WD_ALIGN_PARAGRAPH
-            
             # Create a new document
             doc = Document()
             
@@ -455,15 +1138,9 @@ class DocxConverter(BaseConverter):
                 elif isinstance(template['content'], list):
                     for item in template['content']:
                         if isinstance(item, dict):
-                            if item.get('type') == 'heading':
-                                doc.add_heading(item.get('text', ''), level=item.get('level', 1))
-                            elif item.get('type') == 'paragraph':
-                                p = doc.add_paragraph()
-                                if 'style' in item:
-                                    p.style = item['style']
-                                p.add_run(item.get('text', ''))
-                            elif item.get('type') == 'table':
-                                self._add_table(doc, item)
+                            handler = _CONTENT_HANDLERS.get(item.get('type'))
+                            if handler is not None:
+                                handler(self, doc, item)
                         else:
                             doc.add_paragraph(str(item))
             
@@ -472,16 +1149,11 @@ class DocxConverter(BaseConverter):
                 output_file = 'output.docx'
             
             output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            ensure_dir(output_path.parent)
             doc.save(output_path)
             
             return output_path
             
-        except ImportError as e:
-            raise ConversionError(
-                "python-docx package is required for template conversion. "
-                "Install with: pip install python-docx"
-            ) from e
         except Exception as e:
             raise ConversionError(f"Template conversion failed: {str(e)}") from e
     
@@ -502,11 +1174,17 @@ class DocxConverter(BaseConverter):
         if 'style' in table_data:
             table.style = table_data['style']
         
-        # Add data to table
-        for i, row in enumerate(rows):
-            for j, cell in enumerate(row):
-                table.cell(i, j).text = str(cell)
-    
-    def get_supported_formats(self) -> list:
-        """Get a list of formats this converter can handle."""
-        return self.supported_formats
+        # Add data to table. table.cell() rebuilds the whole cell list on every
+        # call, so wrap each row's <w:tc> elements once and fill them directly.
+        for tr, row in zip(table._tbl.tr_lst, rows):
+            for tc, value in zip(tr.tc_lst, row):
+                _Cell(tc, table).text = str(value)
+    
+    @property
+    def supported_formats(self) -> tuple:
+        """Formats this converter can handle."""
+        return self.SUPPORTED_FORMATS
+    
+    def get_supported_formats(self) -> tuple:
+        """Get the formats this converter can handle."""
+        return self.SUPPORTED_FORMATS
@@ -1,33 +1,301 @@
 """EPUB converter implementation for Redoc."""
 
+import asyncio
+import html
+import io
 import json
 import os
+import posixpath
+import re
+import subprocess
 import tempfile
+import uuid
+import zipfile
+from collections import deque
+from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union, BinaryIO
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union, BinaryIO
+from urllib.parse import unquote
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:  # Optional: C-backed HTML parsing and direct text extraction
+    etree = None
+    lxml_html = None
+
+try:
+    import ebooklib
+    from ebooklib import epub
+except ImportError:  # Optional: EbookLib, needed to read and write EPUB books
+    ebooklib = None
+    epub = None
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:  # Optional: beautifulsoup4, for HTML input and fallbacks
+    BeautifulSoup = None
 
 from . import register_converter, BaseConverter
 from ..exceptions import ConversionError
 
 
+# BeautifulSoup tree builder; lxml parses an order of magnitude faster
+_HTML_PARSER = 'lxml' if lxml_html is not None else 'html.parser'
+
+# Stylesheet embedded in every EPUB to HTML conversion
+_DEFAULT_CSS = """
+    body { font-family: Arial, sans-serif; line-height: 1.6; margin: 40px; max-width: 800px; margin: 0 auto; }
+    h1, h2, h3, h4, h5, h6 { color: #2c3e50; margin-top: 1.5em; }
+    p { margin: 1em 0; text-align: justify; }
+    img { max-width: 100%; height: auto; }
+    .toc { margin: 20px 0; padding: 10px; background: #f5f5f5; border-radius: 5px; }
+    .toc ul { list-style-type: none; padding-left: 20px; }
+    .toc a { text-decoration: none; color: #3498db; }
+    .toc a:hover { text-decoration: underline; }
+    .page-break { page-break-after: always; }
+"""
+
+# Inner markup of an XHTML document's body, sliced out without parsing
+_BODY_RE = re.compile(rb'<body[^>]*>(.*)</body\s*>', re.DOTALL | re.IGNORECASE)
+
+# Formats converted to EPUB by Calibre rather than in Python
+_CALIBRE_SOURCE_FORMATS = frozenset({'pdf', 'docx', 'mobi', 'azw3'})
+
+# Line breaks with surrounding blanks, or runs of blanks within a line;
+# both become a single line break in extracted text
+_WS_RE = re.compile(r'[ \t]*\n[ \t\n]*|[ \t]{2,}')
+
+# Lines of ebook-convert's stderr kept for error messages; it can log
+# megabytes per book
+_STDERR_TAIL_LINES = 200
+
+# Blank lines separating paragraphs of plain-text template content
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n')
+
+# Elements whose text never belongs in extracted plain text
+_NON_TEXT_TAGS = ('script', 'style')
+
+# Conversions out of EPUB, keyed by target format. Names are looked up on the
+# converter so subclasses can override a handler; each is called as
+# handler(source, output_path, target_format=..., **kwargs).
+_FROM_EPUB_DISPATCH = {
+    'html': '_epub_to_html',
+    'txt': '_epub_to_text',
+    'pdf': '_convert_with_calibre',
+    'mobi': '_convert_with_calibre',
+    'azw3': '_convert_with_calibre',
+}
+
+# Already-compressed resources; deflating them again only costs CPU
+_STORED_EXTENSIONS = frozenset({
+    '.jpg', '.jpeg', '.png', '.gif', '.webp',
+    '.mp3', '.m4a', '.mp4', '.woff', '.woff2',
+})
+
+
+@lru_cache(maxsize=8)
+def _read_epub_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Read an EPUB, memoized on its path, modification time and size."""
+    return epub.read_epub(path)
+
+
+def _read_epub_from_bytes(data: bytes) -> Any:
+    """Parse an EPUB held in memory; ebooklib opens it through zipfile like a file on disk."""
+    return epub.read_epub(io.BytesIO(data))
+
+
+def _require_ebooklib(with_bs4: bool = False) -> None:
+    """Raise ConversionError when EbookLib (and optionally BeautifulSoup) is missing."""
+    if epub is None or (with_bs4 and BeautifulSoup is None):
+        raise ConversionError(
+            "Required packages not found. Install with: "
+            "pip install EbookLib beautifulsoup4"
+        )
+
+
+def _load_epub(source: Union[Path, bytes]) -> Any:
+    """Parse an EPUB given as a path (cached) or as raw bytes."""
+    if isinstance(source, bytes):
+        return _read_epub_from_bytes(source)
+    return _read_epub(source)
+
+
+def _read_epub(path: Path) -> Any:
+    """Return the parsed book for ``path``, reusing it while the file is unchanged.
+    
+    The returned book is shared between callers and must not be modified.
+    """
+    path = path.resolve()
+    stat = path.stat()
+    return _read_epub_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+class _MediaStoringZip:
+    """Wrap a writable ZipFile so already-compressed media is stored, not deflated."""
+    
+    def __init__(self, archive: zipfile.ZipFile):
+        self._archive = archive
+    
+    def writestr(self, name, data, compress_type=None, **kwargs):
+        filename = name.filename if isinstance(name, zipfile.ZipInfo) else name
+        if compress_type is None and posixpath.splitext(filename)[1].lower() in _STORED_EXTENSIONS:
+            compress_type = zipfile.ZIP_STORED
+        return self._archive.writestr(name, data, compress_type=compress_type, **kwargs)
+    
+    def __getattr__(self, name):
+        return getattr(self._archive, name)
+
+
+if epub is not None:
+    class _EpubWriter(epub.EpubWriter):
+        """EpubWriter that picks the compression per entry.
+        
+        ebooklib deflates every entry of the archive. Book items are written
+        through ``_MediaStoringZip`` instead, so images, audio, video and
+        fonts go in stored as they are written.
+        """
+        
+        def _write_items(self):
+            archive = self.out
+            self.out = _MediaStoringZip(archive)
+            try:
+                super()._write_items()
+            finally:
+                self.out = archive
+else:
+    _EpubWriter = None
+
+
+def _write_book(book: Any, output_path: Path) -> Path:
+    """Write ``book`` to ``output_path`` atomically.
+    
+    The archive is built in memory and written to a temporary file next to
+    the target, which then replaces it, so a failed conversion never leaves
+    a partial EPUB behind.
+    """
+    buf = io.BytesIO()
+    writer = _EpubWriter(buf, book, {})
+    writer.process()
+    writer.write()
+    data = buf.getvalue()
+    
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique sibling name; unlike mkstemp, open() applies the usual umask
+    tmp_path = output_path.with_name(f'.{output_path.name}.{uuid.uuid4().hex}.tmp')
+    try:
+        with open(tmp_path, 'xb') as f:
+            f.write(data)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            tmp_path.unlink()
+        raise
+    return output_path
+
+
+def _body_markup(content: bytes) -> bytes:
+    """Return the markup inside an XHTML document's ``<body>``.
+    
+    EPUB documents are well-formed XHTML, so the body is normally sliced out
+    with a regex; BeautifulSoup is only used when that finds no body.
+    """
+    match = _BODY_RE.search(content)
+    if match is not None or BeautifulSoup is None:
+        return match.group(1) if match is not None else content
+    
+    soup = BeautifulSoup(content, _HTML_PARSER)
+    root = soup.body or soup
+    return root.decode_contents().encode('utf-8')
+
+
+def _book_identifier(title: str) -> str:
+    """Derive a stable book identifier from its title.
+    
+    Unlike ``hash()``, the result is the same in every process, so generated
+    books can be recognised (and cached) across runs.
+    """
+    return uuid.uuid5(uuid.NAMESPACE_URL, f'redoc:{title}').urn
+
+
+def _local_name(tag: Any) -> str:
+    return tag.rpartition('}')[2] if isinstance(tag, str) else ''
+
+
+def _extract_text_fast(path: Union[Path, bytes]) -> Optional[List[str]]:
+    """Extract the text of each spine document straight from the EPUB archive.
+    
+    Reads only the container, the OPF package file and the spine documents,
+    skipping the full book model ebooklib builds. Returns None when lxml is
+    not installed or the archive is not laid out as expected, so callers can
+    fall back to ebooklib.
+    """
+    if lxml_html is None:
+        return None
+    
+    try:
+        with zipfile.ZipFile(io.BytesIO(path) if isinstance(path, bytes) else path) as zf:
+            container = etree.fromstring(zf.read('META-INF/container.xml'))
+            rootfile = next(
+                (el for el in container.iter() if _local_name(el.tag) == 'rootfile'),
+                None
+            )
+            if rootfile is None or not rootfile.get('full-path'):
+                return None
+            opf_path = rootfile.get('full-path')
+            opf_dir = posixpath.dirname(opf_path)
+            
+            # Collect the manifest and the spine order in one streaming pass
+            manifest: Dict[str, str] = {}
+            spine: List[str] = []
+            with zf.open(opf_path) as opf:
+                for _, elem in etree.iterparse(opf, events=('end',)):
+                    name = _local_name(elem.tag)
+                    if name == 'item':
+                        manifest[elem.get('id')] = elem.get('href')
+                    elif name == 'itemref':
+                        spine.append(elem.get('idref'))
+                    elem.clear()
+            
+            texts = []
+            for idref in spine:
+                href = manifest[idref].partition('#')[0]
+                name = posixpath.normpath(posixpath.join(opf_dir, unquote(href)))
+                data = zf.read(name)
+                if not data.strip():
+                    continue
+                doc = lxml_html.fromstring(data)
+                etree.strip_elements(doc, etree.Comment, *_NON_TEXT_TAGS, with_tail=False)
+                texts.append(_WS_RE.sub('\n', '\n'.join(doc.itertext())).strip())
+            return texts
+        
+    except (KeyError, zipfile.BadZipFile, etree.LxmlError):
+        return None
+
+
 @register_converter('epub')
 class EpubConverter(BaseConverter):
     """Converter for EPUB e-book format."""
     
-    def __init__(self):
-        self.supported_formats = ['pdf', 'html', 'txt', 'mobi', 'azw3']
+    SUPPORTED_FORMATS = frozenset({'pdf', 'html', 'txt', 'mobi', 'azw3'})
+    
+    # Whether ebook-convert runs; probed once per process on first use
+    _calibre_available: Optional[bool] = None
     
     def convert(
         self,
-        source: Union[str, Path, Dict],
+        source: Union[str, Path, Dict, bytes, BinaryIO],
         output_file: Optional[Union[str, Path]] = None,
         **kwargs
     ) -> Any:
         """Convert to/from EPUB format.
         
         Args:
-            source: Source file path or template dictionary
-            output_file: Optional output file path
+            source: Source file path, template dictionary, or EPUB content as
+                bytes or a binary file object (converted from EPUB without
+                touching the disk where the target format allows)
+            output_file: Optional output file path (required for in-memory sources)
             **kwargs: Additional conversion options
                 - from_format: Source format if not inferrable from source
                 - to_format: Target format if not inferrable from output_file
@@ -38,6 +306,16 @@ class EpubConverter(BaseConverter):
             # Handle template input
             if isinstance(source, dict):
                 return self._convert_from_template(source, output_file, **kwargs)
+            
+            # Handle EPUB content already in memory
+            if isinstance(source, (bytes, bytearray, memoryview)) or hasattr(source, 'read'):
+                if output_file is None:
+                    raise ValueError("output_file must be specified for in-memory sources")
+                data = source.read() if hasattr(source, 'read') else bytes(source)
+                output_path = Path(output_file)
+                to_format = kwargs.pop('to_format', output_path.suffix[1:].lower())
+                kwargs.pop('from_format', None)
+                return self._convert_from_epub(data, output_path, to_format, **kwargs)
                 
             source_path = Path(source)
             
@@ -49,8 +327,8 @@ class EpubConverter(BaseConverter):
                 output_file = source_path.with_suffix(f'.{to_format}')
             
             output_path = Path(output_file)
-            from_format = kwargs.get('from_format', 'epub' if source_path.suffix.lower() == '.epub' else None)
-            to_format = kwargs.get('to_format', output_path.suffix[1:].lower())
+            from_format = kwargs.pop('from_format', 'epub' if source_path.suffix.lower() == '.epub' else None)
+            to_format = kwargs.pop('to_format', output_path.suffix[1:].lower())
             
             if from_format == 'epub':
                 return self._convert_from_epub(source_path, output_path, to_format, **kwargs)
@@ -62,31 +340,17 @@ class EpubConverter(BaseConverter):
     
     def _convert_from_epub(
         self,
-        source_path: Path,
+        source_path: Union[Path, bytes],
         output_path: Path,
         to_format: str,
         **kwargs
     ) -> Path:
         """Convert from EPUB to another format."""
         try:
-            if to_format == 'pdf':
-                # Convert EPUB to PDF using ebook-convert (Calibre)
-                return self._convert_with_calibre(source_path, output_path, 'pdf', **kwargs)
-                
-            elif to_format == 'html':
-                # Convert EPUB to HTML
-                return self._epub_to_html(source_path, output_path, **kwargs)
-                
-            elif to_format == 'txt':
-                # Convert EPUB to plain text
-                return self._epub_to_text(source_path, output_path, **kwargs)
-                
-            elif to_format in ['mobi', 'azw3']:
-                # Convert between ebook formats using Calibre
-                return self._convert_with_calibre(source_path, output_path, to_format, **kwargs)
-                
-            else:
+            handler = _FROM_EPUB_DISPATCH.get(to_format)
+            if handler is None:
                 raise ConversionError(f"Conversion from EPUB to {to_format} not supported")
+            return getattr(self, handler)(source_path, output_path, target_format=to_format, **kwargs)
             
         except Exception as e:
             raise ConversionError(f"Failed to convert EPUB to {to_format}: {str(e)}") from e
@@ -108,7 +372,7 @@ class EpubConverter(BaseConverter):
                 # Convert plain text to EPUB
                 return self._text_to_epub(source_path, output_path, **kwargs)
                 
-            elif from_format in ['pdf', 'docx', 'mobi', 'azw3']:
+            elif from_format in _CALIBRE_SOURCE_FORMATS:
                 # Convert between formats using Calibre
                 return self._convert_with_calibre(source_path, output_path, 'epub', **kwargs)
                 
@@ -120,225 +384,213 @@ class EpubConverter(BaseConverter):
     
     def _epub_to_html(
         self,
-        source_path: Path,
+        source_path: Union[Path, bytes],
         output_path: Path,
         **kwargs
     ) -> Path:
         """Convert EPUB to HTML."""
+        _require_ebooklib()
+        
         try:
-            import ebooklib
-            from ebooklib import epub
-            from bs4 import BeautifulSoup
-            
             # Read the EPUB file
-            book = epub.read_epub(str(source_path))
-            
-            # Create a new BeautifulSoup document for the output
-            soup = BeautifulSoup('', 'html.parser')
-            html = soup.new_tag('html')
-            soup.append(html)
-            
-            # Add head and body
-            head = soup.new_tag('head')
-            html.append(head)
-            
-            title = soup.new_tag('title')
-            title.string = book.get_metadata('DC', 'title')[0][0] if book.get_metadata('DC', 'title') else 'EPUB Export'
-            head.append(title)
-            
-            # Add CSS
-            style = soup.new_tag('style')
-            style.string = """
-                body { font-family: Arial, sans-serif; line-height: 1.6; margin: 40px; max-width: 800px; margin: 0 auto; }
-                h1, h2, h3, h4, h5, h6 { color: #2c3e50; margin-top: 1.5em; }
-                p { margin: 1em 0; text-align: justify; }
-                img { max-width: 100%; height: auto; }
-                .toc { margin: 20px 0; padding: 10px; background: #f5f5f5; border-radius: 5px; }
-                .toc ul { list-style-type: none; padding-left: 20px; }
-                .toc a { text-decoration: none; color: #3498db; }
-                .toc a:hover { text-decoration: underline; }
-                .page-break { page-break-after: always; }
-            """
-            head.append(style)
-            
-            body = soup.new_tag('body')
-            html.append(body)
-            
-            # Add title
-            if title.string:
-                h1 = soup.new_tag('h1')
-                h1.string = title.string
-                body.append(h1)
-            
-            # Add author if available
+            book = _load_epub(source_path)
+            
+            titles = book.get_metadata('DC', 'title')
+            title = titles[0][0] if titles else 'EPUB Export'
             authors = book.get_metadata('DC', 'creator')
-            if authors:
-                p = soup.new_tag('p', style='font-style: italic; color: #666;')
-                p.string = f"Author: {', '.join(a[0] for a in authors)}"
-                body.append(p)
             
-            # Add table of contents
-            self._add_epub_toc(book, body, soup)
-            
-            # Add content
-            for item in book.get_items():
-                if item.get_type() == ebooklib.ITEM_DOCUMENT:
-                    # Parse the content
-                    item_soup = BeautifulSoup(item.get_content(), 'html.parser')
-                    
-                    # Add a page break before each chapter
-                    if body.contents:  # Don't add at the very beginning
-                        hr = soup.new_tag('hr', **{'class': 'page-break'})
-                        body.append(hr)
-                    
-                    # Add the content
-                    body.append(item_soup)
-            
-            # Write the output file
+            # Stream the document out item by item instead of building one
+            # tree for the whole book
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(soup.prettify())
+            with open(output_path, 'wb') as f:
+                head = (
+                    '<!DOCTYPE html>\n<html>\n<head>\n'
+                    '<meta charset="utf-8">\n'
+                    f'<title>{html.escape(title)}</title>\n'
+                    f'<style>{_DEFAULT_CSS}</style>\n'
+                    '</head>\n<body>\n'
+                )
+                f.write(head.encode('utf-8'))
+                
+                # Add title
+                if title:
+                    f.write(f'<h1>{html.escape(title)}</h1>\n'.encode('utf-8'))
+                
+                # Add author if available
+                if authors:
+                    names = html.escape(', '.join(a[0] for a in authors))
+                    f.write(
+                        f'<p style="font-style: italic; color: #666;">Author: {names}</p>\n'.encode('utf-8')
+                    )
+                
+                # Add table of contents
+                f.write(self._render_epub_toc(book).encode('utf-8'))
+                
+                # Add content, with a page break before each chapter
+                for item in book.get_items():
+                    if item.get_type() == ebooklib.ITEM_DOCUMENT:
+                        f.write(b'\n<hr class="page-break"/>\n')
+                        f.write(_body_markup(item.get_content()))
+                
+                f.write(b'\n</body>\n</html>\n')
             
             return output_path
             
-        except ImportError as e:
-            raise ConversionError(
-                "Required packages not found. Install with: "
-                "pip install EbookLib beautifulsoup4"
-            ) from e
         except Exception as e:
             raise ConversionError(f"Failed to convert EPUB to HTML: {str(e)}") from e
     
-    def _add_epub_toc(
-        self,
-        book: 'epub.EpubBook',
-        body: 'BeautifulSoup',
-        soup: 'BeautifulSoup'
-    ) -> None:
-        """Add table of contents to the HTML output."""
+    def _render_epub_toc(self, book: 'epub.EpubBook') -> str:
+        """Render the table of contents as an HTML string.
+        
+        The NCX navigation document is streamed when lxml is available;
+        otherwise ebooklib's parsed ``book.toc`` is walked.
+        """
         try:
-            # Create TOC div
-            toc_div = soup.new_tag('div', **{'class': 'toc'})
-            h2 = soup.new_tag('h2')
-            h2.string = 'Table of Contents'
-            toc_div.append(h2)
-            
-            # Create TOC list
-            toc_list = soup.new_tag('ul')
-            
-            # Add TOC items
-            for item in book.toc:
-                self._add_toc_item(item, toc_list, soup)
-            
-            toc_div.append(toc_list)
-            body.append(toc_div)
+            buf = ['<div class="toc">\n<h2>Table of Contents</h2>\n<ul>']
+            if not self._render_ncx_toc(book, buf):
+                for item in book.toc:
+                    self._render_toc_item(item, buf)
+            buf.append('</ul>\n</div>\n')
+            return ''.join(buf)
             
         except Exception as e:
             # If TOC generation fails, just continue without it
-            pass
+            return ''
     
-    def _add_toc_item(
-        self,
-        item: Any,
-        parent: 'BeautifulSoup',
-        soup: 'BeautifulSoup'
-    ) -> None:
-        """Recursively add TOC items."""
-        li = soup.new_tag('li')
+    def _render_ncx_toc(self, book: 'epub.EpubBook', buf: List[str]) -> bool:
+        """Append TOC entries streamed from the book's NCX file to ``buf``.
+        
+        Returns False, leaving ``buf`` untouched, when lxml is unavailable or
+        the book has no readable NCX.
+        """
+        if etree is None:
+            return False
+        
+        ncx = next(iter(book.get_items_of_type(ebooklib.ITEM_NAVIGATION)), None)
+        if ncx is None:
+            return False
+        
+        # One entry per open navPoint: [label, src, head written, child list open]
+        stack: List[list] = []
+        entries: List[str] = []
+        
+        def write_head(state: list) -> None:
+            title = html.escape(state[0] or 'Untitled')
+            if state[1]:
+                entries.append(f'<li><a href="#{html.escape(state[1])}">{title}</a>')
+            else:
+                entries.append(f'<li><span>{title}</span>')
+            state[2] = True
+        
+        try:
+            for event, elem in etree.iterparse(
+                io.BytesIO(ncx.get_content()), events=('start', 'end')
+            ):
+                name = _local_name(elem.tag)
+                if event == 'start':
+                    if name == 'navPoint':
+                        if stack and not stack[-1][3]:
+                            if not stack[-1][2]:
+                                write_head(stack[-1])
+                            entries.append('<ul>')
+                            stack[-1][3] = True
+                        stack.append([None, None, False, False])
+                    continue
+                
+                if not stack:
+                    continue
+                state = stack[-1]
+                if name == 'text' and state[0] is None:
+                    state[0] = (elem.text or '').strip()
+                elif name == 'content' and state[1] is None:
+                    state[1] = elem.get('src')
+                elif name == 'navPoint':
+                    if not state[2]:
+                        write_head(state)
+                    if state[3]:
+                        entries.append('</ul>')
+                    entries.append('</li>')
+                    stack.pop()
+                    elem.clear()
+        except etree.LxmlError:
+            return False
+        
+        buf.extend(entries)
+        return True
+    
+    def _render_toc_item(self, item: Any, buf: List[str]) -> None:
+        """Recursively append the markup for a TOC item to ``buf``."""
+        title = html.escape(getattr(item, 'title', None) or 'Untitled')
         
         # Create link if href exists
-        if hasattr(item, 'href') and item.href:
-            a = soup.new_tag('a', href=f"#{item.href}")
-            a.string = item.title
-            li.append(a)
+        href = getattr(item, 'href', None)
+        if href:
+            buf.append(f'<li><a href="#{html.escape(href)}">{title}</a>')
         else:
-            span = soup.new_tag('span')
-            span.string = item.title if hasattr(item, 'title') else 'Untitled'
-            li.append(span)
+            buf.append(f'<li><span>{title}</span>')
         
         # Add sub-items if they exist
-        if hasattr(item, 'items') and item.items:
-            sub_ul = soup.new_tag('ul')
-            for sub_item in item.items:
-                self._add_toc_item(sub_item, sub_ul, soup)
-            li.append(sub_ul)
+        sub_items = getattr(item, 'items', None)
+        if sub_items:
+            buf.append('<ul>')
+            for sub_item in sub_items:
+                self._render_toc_item(sub_item, buf)
+            buf.append('</ul>')
         
-        parent.append(li)
+        buf.append('</li>')
     
     def _epub_to_text(
         self,
-        source_path: Path,
+        source_path: Union[Path, bytes],
         output_path: Path,
         **kwargs
     ) -> Path:
-        """Convert EPUB to plain text."""
+        """Convert EPUB to plain text.
+        
+        Text is extracted from each document in a single pass and written
+        straight to the output file, without an intermediate HTML rendering
+        of the book. The archive is read directly when possible; ebooklib is
+        only used as a fallback.
+        """
         try:
-            # First convert to HTML
-            temp_html = output_path.with_suffix('.html')
-            self._epub_to_html(source_path, temp_html, **kwargs)
-            
-            # Then convert HTML to text
-            from bs4 import BeautifulSoup
+            texts = _extract_text_fast(source_path)
+            if texts is None:
+                texts = self._epub_item_texts(source_path)
             
-            with open(temp_html, 'r', encoding='utf-8') as f:
-                soup = BeautifulSoup(f, 'html.parser')
-            
-            # Remove scripts and styles
-            for script in soup(['script', 'style']):
-                script.decompose()
-            
-            # Get text
-            text = soup.get_text()
-            
-            # Clean up whitespace
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split('  '))
-            text = '\n'.join(chunk for chunk in chunks if chunk)
-            
-            # Write to output file
             output_path.parent.mkdir(parents=True, exist_ok=True)
             with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(text)
-            
-            # Clean up temporary file
-            try:
-                temp_html.unlink()
-            except:
-                pass
+                separator = ''
+                for text in texts:
+                    if text:
+                        f.write(separator)
+                        f.write(text)
+                        separator = '\n\n'
             
             return output_path
             
         except Exception as e:
-            # If HTML conversion fails, try a simpler approach
-            try:
-                import ebooklib
-                from ebooklib import epub
-                
-                # Read the EPUB file
-                book = epub.read_epub(str(source_path))
-                
-                # Extract text from all items
-                text_parts = []
-                for item in book.get_items():
-                    if item.get_type() == ebooklib.ITEM_DOCUMENT:
-                        from bs4 import BeautifulSoup
-                        soup = BeautifulSoup(item.get_content(), 'html.parser')
-                        text_parts.append(soup.get_text('\n', strip=True))
-                
-                # Combine text parts
-                text = '\n\n'.join(text_parts)
-                
-                # Write to output file
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(text)
-                
-                return output_path
-                
-            except Exception as e2:
-                raise ConversionError(
-                    f"Failed to convert EPUB to text: {str(e)}; Fallback also failed: {str(e2)}"
-                ) from e2
+            raise ConversionError(f"Failed to convert EPUB to text: {str(e)}") from e
+    
+    def _epub_item_texts(self, source_path: Union[Path, bytes]) -> Iterator[str]:
+        """Return an iterator over the text of each document item, parsed with ebooklib."""
+        _require_ebooklib(with_bs4=True)
+        
+        # Read the EPUB file up front so failures surface before any output
+        book = _load_epub(source_path)
+        
+        def item_text(item: Any) -> str:
+            soup = BeautifulSoup(item.get_content(), _HTML_PARSER)
+            
+            # Remove scripts and styles
+            for script in soup(_NON_TEXT_TAGS):
+                script.decompose()
+            
+            return _WS_RE.sub('\n', soup.get_text('\n')).strip()
+        
+        return (
+            item_text(item) for item in book.get_items()
+            if item.get_type() == ebooklib.ITEM_DOCUMENT
+        )
     
     def _html_to_epub(
         self,
@@ -347,67 +599,71 @@ class EpubConverter(BaseConverter):
         **kwargs
     ) -> Path:
         """Convert HTML to EPUB."""
+        _require_ebooklib(with_bs4=True)
+        
         try:
-            from ebooklib import epub
-            from bs4 import BeautifulSoup
-            
             # Read HTML content
             with open(source_path, 'r', encoding='utf-8') as f:
                 html_content = f.read()
             
             # Parse HTML
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, _HTML_PARSER)
             
-            # Create a new EPUB book
-            book = epub.EpubBook()
-            
-            # Set metadata
-            title = kwargs.get('title', soup.title.string if soup.title else 'Untitled Document')
-            book.set_title(title)
-            
-            author = kwargs.get('author', 'Unknown')
-            book.add_author(author)
-            
-            book.set_identifier('id' + str(hash(title)))
-            book.set_language(kwargs.get('language', 'en'))
-            
-            # Create a chapter
-            chapter = epub.EpubHtml(
-                title='Content',
-                file_name='content.xhtml',
-                lang=kwargs.get('language', 'en')
-            )
+            title = kwargs.pop('title', soup.title.string if soup.title else 'Untitled Document')
             
             # Set the content (preserve the HTML structure)
-            chapter.content = str(soup.body) if soup.body else str(soup)
+            content = str(soup.body) if soup.body else str(soup)
             
-            # Add the chapter to the book
-            book.add_item(chapter)
+            return self._write_single_chapter_epub(content, output_path, title, **kwargs)
             
-            # Add table of contents
-            book.toc = (epub.Link('content.xhtml', 'Content', 'content'),)
-            
-            # Add navigation files
-            book.add_item(epub.EpubNcx())
-            book.add_item(epub.EpubNav())
-            
-            # Create spine
-            book.spine = ['nav', chapter]
-            
-            # Write the EPUB file
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            epub.write_epub(str(output_path), book, {})
-            
-            return output_path
-            
-        except ImportError as e:
-            raise ConversionError(
-                "Required packages not found. Install with: "
-                "pip install EbookLib beautifulsoup4"
-            ) from e
         except Exception as e:
             raise ConversionError(f"Failed to convert HTML to EPUB: {str(e)}") from e
     
+    def _write_single_chapter_epub(
+        self,
+        content: str,
+        output_path: Path,
+        title: str,
+        **kwargs
+    ) -> Path:
+        """Write an EPUB whose only chapter holds ``content``."""
+        # Create a new EPUB book
+        book = epub.EpubBook()
+        
+        # Set metadata
+        book.set_title(title)
+        
+        author = kwargs.get('author', 'Unknown')
+        book.add_author(author)
+        
+        book.set_identifier(_book_identifier(title))
+        book.set_language(kwargs.get('language', 'en'))
+        
+        # Create a chapter
+        chapter = epub.EpubHtml(
+            title='Content',
+            file_name='content.xhtml',
+            lang=kwargs.get('language', 'en')
+        )
+        
+        chapter.content = content
+        
+        # Add the chapter to the book
+        book.add_item(chapter)
+        
+        # Add table of contents
+        book.toc = (epub.Link('content.xhtml', 'Content', 'content'),)
+        
+        # Add navigation files
+        book.add_item(epub.EpubNcx())
+        book.add_item(epub.EpubNav())
+        
+        # Create spine
+        book.spine = ['nav', chapter]
+        
+        # Write the EPUB file
+        return _write_book(book, output_path)
+    
     def _text_to_epub(
         self,
         source_path: Path,
@@ -415,99 +671,199 @@ class EpubConverter(BaseConverter):
         **kwargs
     ) -> Path:
         """Convert plain text to EPUB."""
+        _require_ebooklib()
+        
         try:
-            # Read text content
+            # Read and escape the text in one go; it becomes the chapter body as-is
             with open(source_path, 'r', encoding='utf-8') as f:
-                text_content = f.read()
-            
-            # Create a temporary HTML file
-            with tempfile.NamedTemporaryFile(suffix='.html', mode='w', delete=False, encoding='utf-8') as f:
-                f.write(f"""
-                <!DOCTYPE html>
-                <html>
-                <head>
-                    <title>{kwargs.get('title', 'Text Document')}</title>
-                    <meta charset="utf-8">
-                </head>
-                <body>
-                    <pre>{text_content}</pre>
-                </body>
-                </html>
-                """)
-                temp_html = f.name
+                content = f'<body><pre>{html.escape(f.read(), quote=False)}</pre></body>'
+            
+            title = kwargs.pop('title', 'Text Document')
+            return self._write_single_chapter_epub(content, output_path, title, **kwargs)
             
-            try:
-                # Convert HTML to EPUB
-                return self._html_to_epub(
-                    Path(temp_html),
-                    output_path,
-                    **kwargs
-                )
-            finally:
-                # Clean up temporary file
-                try:
-                    os.unlink(temp_html)
-                except:
-                    pass
-                    
         except Exception as e:
             raise ConversionError(f"Failed to convert text to EPUB: {str(e)}") from e
     
-    def _convert_with_calibre(
-        self,
-        source_path: Path,
-        output_path: Path,
-        target_format: str,
-        **kwargs
-    ) -> Path:
-        """Convert between ebook formats using Calibre's ebook-convert."""
-        try:
-            import subprocess
-            
-            # Check if ebook-convert is available
+    @classmethod
+    def _ensure_calibre(cls) -> None:
+        """Raise ConversionError unless Calibre's ebook-convert is available.
+        
+        The check spawns ``ebook-convert --version`` only the first time; the
+        result is kept for the lifetime of the process.
+        """
+        if cls._calibre_available is None:
             try:
                 subprocess.run(
                     ['ebook-convert', '--version'],
                     check=True,
-                    capture_output=True,
-                    text=True
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
                 )
+                cls._calibre_available = True
             except (FileNotFoundError, subprocess.CalledProcessError):
+                cls._calibre_available = False
+        
+        if not cls._calibre_available:
+            raise ConversionError(
+                "Calibre's ebook-convert tool is required for this conversion. "
+                "Please install Calibre from https://calibre-ebook.com/"
+            )
+    
+    @staticmethod
+    def _calibre_command(source_path: Path, output_path: Path, **kwargs) -> List[str]:
+        """Build the ebook-convert command line for one conversion."""
+        cmd = [
+            'ebook-convert',
+            str(source_path),
+            str(output_path),
+            '--output-profile', 'tablet',  # Optimize for tablet reading
+        ]
+        
+        # Add title if provided
+        if 'title' in kwargs:
+            cmd.extend(['--title', str(kwargs['title'])])
+        
+        # Add author if provided
+        if 'author' in kwargs:
+            cmd.extend(['--authors', str(kwargs['author'])])
+        
+        return cmd
+    
+    @staticmethod
+    def _run_calibre(cmd: List[str]) -> str:
+        """Run an ebook-convert command and return the tail of its stderr.
+        
+        stdout is discarded and only the last ``_STDERR_TAIL_LINES`` lines of
+        stderr are kept, so verbose conversions do not pile up in memory.
+        
+        Raises:
+            subprocess.CalledProcessError: If the command exits non-zero
+        """
+        tail = deque(maxlen=_STDERR_TAIL_LINES)
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        ) as process:
+            for line in process.stderr:
+                tail.append(line)
+        
+        stderr = b''.join(tail).decode('utf-8', 'replace')
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, cmd, stderr=stderr)
+        return stderr
+    
+    def convert_many(
+        self,
+        sources: List[Union[str, Path]],
+        output_dir: Union[str, Path],
+        target_format: str,
+        max_workers: Optional[int] = None,
+        **kwargs
+    ) -> List[Path]:
+        """Convert several e-books with Calibre concurrently.
+        
+        Each ebook-convert process is single-threaded, so up to
+        ``max_workers`` of them are run side by side. Must not be called from
+        a running event loop.
+        
+        Args:
+            sources: Files to convert
+            output_dir: Directory to write the converted files to
+            target_format: Target format understood by ebook-convert (e.g. pdf, mobi, azw3, epub)
+            max_workers: Maximum concurrent conversions (default: CPU count)
+            **kwargs: Options passed to every conversion (title, author)
+            
+        Returns:
+            Output paths, in the same order as ``sources``
+        """
+        self._ensure_calibre()
+        
+        output_dir = Path(output_dir)
+        source_paths = [Path(source) for source in sources]
+        output_paths = [output_dir / f'{path.stem}.{target_format}' for path in source_paths]
+        if len(set(output_paths)) != len(output_paths):
+            raise ConversionError("Batch sources must have distinct file names")
+        
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        results = asyncio.run(self._run_calibre_many(
+            list(zip(source_paths, output_paths)),
+            max_workers or os.cpu_count() or 1,
+            **kwargs
+        ))
+        
+        # Let every conversion finish before reporting the first failure
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+    
+    async def _run_calibre_many(
+        self,
+        pairs: List[Tuple[Path, Path]],
+        max_workers: int,
+        **kwargs
+    ) -> List[Any]:
+        """Run ebook-convert for each (source, output) pair, at most ``max_workers`` at a time."""
+        semaphore = asyncio.Semaphore(max_workers)
+        
+        async def run_one(source_path: Path, output_path: Path) -> Path:
+            async with semaphore:
+                process = await asyncio.create_subprocess_exec(
+                    *self._calibre_command(source_path, output_path, **kwargs),
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                tail = deque(maxlen=_STDERR_TAIL_LINES)
+                async for line in process.stderr:
+                    tail.append(line)
+                await process.wait()
+            
+            if process.returncode != 0:
                 raise ConversionError(
-                    "Calibre's ebook-convert tool is required for this conversion. "
-                    "Please install Calibre from https://calibre-ebook.com/"
+                    f"ebook-convert failed for {source_path} with return code "
+                    f"{process.returncode}: {b''.join(tail).decode('utf-8', 'replace')}"
                 )
+            if not output_path.exists():
+                raise ConversionError(f"Conversion failed: {source_path} produced no output")
+            return output_path
+        
+        return await asyncio.gather(
+            *(run_one(source, output) for source, output in pairs),
+            return_exceptions=True
+        )
+    
+    def _convert_with_calibre(
+        self,
+        source_path: Union[Path, bytes],
+        output_path: Path,
+        target_format: str,
+        **kwargs
+    ) -> Path:
+        """Convert between ebook formats using Calibre's ebook-convert."""
+        if isinstance(source_path, bytes):
+            # ebook-convert only reads files, so in-memory EPUBs are spilled
+            fd, temp_epub = tempfile.mkstemp(suffix='.epub')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(source_path)
+                return self._convert_with_calibre(Path(temp_epub), output_path, target_format, **kwargs)
+            finally:
+                os.unlink(temp_epub)
+        
+        try:
+            self._ensure_calibre()
             
             # Create output directory if it doesn't exist
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Run ebook-convert
-            cmd = [
-                'ebook-convert',
-                str(source_path),
-                str(output_path),
-                '--output-profile', 'tablet',  # Optimize for tablet reading
-            ]
-            
-            # Add title if provided
-            if 'title' in kwargs:
-                cmd.extend(['--title', str(kwargs['title'])])
-            
-            # Add author if provided
-            if 'author' in kwargs:
-                cmd.extend(['--authors', str(kwargs['author'])])
-            
             # Run the command
-            result = subprocess.run(
-                cmd,
-                check=True,
-                capture_output=True,
-                text=True
-            )
+            stderr = self._run_calibre(self._calibre_command(source_path, output_path, **kwargs))
             
             if not output_path.exists():
                 raise ConversionError(
-                    f"Conversion failed: {result.stderr or 'Unknown error'}"
+                    f"Conversion failed: {stderr or 'Unknown error'}"
                 )
             
             return output_path
@@ -525,11 +881,16 @@ class EpubConverter(BaseConverter):
         output_file: Optional[Union[str, Path]] = None,
         **kwargs
     ) -> Path:
-        """Convert a template to EPUB."""
+        """Convert a template to EPUB.
+        
+        Chapter ``content`` is inserted as HTML without being parsed here;
+        ebooklib parses each chapter once when the book is written. Set a
+        chapter's ``content_is_html`` to False to have its content escaped
+        as plain text instead, one paragraph per blank-line separated block.
+        """
+        _require_ebooklib()
+        
         try:
-            from ebooklib import epub
-            from bs4 import BeautifulSoup
-            
             # Create a new EPUB book
             book = epub.EpubBook()
             
@@ -543,7 +904,7 @@ class EpubConverter(BaseConverter):
             for author in authors:
                 book.add_author(author)
             
-            book.set_identifier(template.get('id', f'id{hash(title)}'))
+            book.set_identifier(template.get('id') or _book_identifier(title))
             book.set_language(template.get('language', 'en'))
             
             # Add cover image if provided
@@ -575,20 +936,17 @@ class EpubConverter(BaseConverter):
                     lang=template.get('language', 'en')
                 )
                 
-                # Add content (wrap in proper HTML structure)
-                soup = BeautifulSoup('<div>', 'html.parser')
-                div = soup.div
-                
-                # Add title
-                h1 = soup.new_tag('h1')
-                h1.string = chapter_title
-                div.append(h1)
-                
-                # Add content
-                content_soup = BeautifulSoup(chapter_content, 'html.parser')
-                div.append(content_soup)
+                if not chapter_data.get('content_is_html', True):
+                    chapter_content = ''.join(
+                        f'<p>{html.escape(block.strip())}</p>'
+                        for block in _PARAGRAPH_BREAK_RE.split(chapter_content)
+                        if block.strip()
+                    )
                 
-                chapter.content = str(soup)
+                # Add title and content (wrap in proper HTML structure)
+                chapter.content = (
+                    f'<div><h1>{html.escape(chapter_title)}</h1>{chapter_content}</div>'
+                )
                 
                 # Add to book
                 book.add_item(chapter)
@@ -612,21 +970,21 @@ class EpubConverter(BaseConverter):
             if output_file is None:
                 output_file = 'output.epub'
             
-            output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            epub.write_epub(str(output_path), book, {})
-            
-            return output_path
+            return _write_book(book, Path(output_file))
             
-        except ImportError as e:
-            raise ConversionError(
-                "Required packages not found. Install with: "
-                "pip install EbookLib beautifulsoup4"
-            ) from e
         except Exception as e:
             raise ConversionError(f"Template conversion failed: {str(e)}") from e
     
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all EPUB books kept from earlier conversions."""
+        _read_epub_cached.cache_clear()
+    
+    @property
+    def supported_formats(self) -> frozenset:
+        """Formats this converter can handle."""
+        return self.SUPPORTED_FORMATS
+    
     def get_supported_formats(self) -> list:
         """Get a list of formats this converter can handle."""
-        return self.supported_formats
+        return sorted(self.SUPPORTED_FORMATS)
@@ -1,10 +1,60 @@
 """HTML converter implementation for Redoc."""
 
+import os
+import re
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:  # Optional: C-backed HTML parsing
+    etree = None
+    lxml_html = None
 
 from . import register_converter, BaseConverter
 from ..exceptions import ConversionError
+from ..utils import get_template_env
+
+
+# BeautifulSoup tree builder; lxml parses an order of magnitude faster
+_HTML_PARSER = 'lxml' if lxml_html is not None else 'html.parser'
+
+# Stylesheet links, dropped from the HTML when the caller supplies the CSS
+_LINK_CSS_RE = re.compile(r'<link[^>]+rel=["\']stylesheet["\'][^>]*>', re.IGNORECASE)
+
+# Parsed WeasyPrint stylesheets, keyed by resolved path and modification time
+_CSS_CACHE: Dict[Tuple[str, int], Any] = {}
+
+# WeasyPrint font configuration shared by all PDF renders; built on first use
+_FONT_CONFIG = None
+
+
+def _get_font_config() -> Any:
+    """Return the process-wide WeasyPrint FontConfiguration."""
+    global _FONT_CONFIG
+    if _FONT_CONFIG is None:
+        from weasyprint.text.fonts import FontConfiguration
+        _FONT_CONFIG = FontConfiguration()
+    return _FONT_CONFIG
+
+
+def _get_stylesheets(paths: Iterable[Union[str, Path]]) -> List[Any]:
+    """Return parsed WeasyPrint CSS objects for ``paths``, parsing each file once.
+    
+    A stylesheet is parsed again only when its modification time changes.
+    """
+    from weasyprint import CSS
+    
+    stylesheets = []
+    for path in paths:
+        resolved = os.path.realpath(path)
+        key = (resolved, os.stat(resolved).st_mtime_ns)
+        css = _CSS_CACHE.get(key)
+        if css is None:
+            css = _CSS_CACHE[key] = CSS(filename=resolved, font_config=_get_font_config())
+        stylesheets.append(css)
+    return stylesheets
 
 
 @register_converter('html')
@@ -28,6 +78,10 @@ class HtmlConverter(BaseConverter):
             **kwargs: Additional conversion options
                 - from_format: Source format if not inferrable from source
                 - to_format: Target format if not inferrable from output_file
+                - stylesheets: CSS files to apply when rendering PDF; each is
+                  parsed once per process
+                - strip_link_css: Remove ``<link rel="stylesheet">`` tags before
+                  rendering PDF (use with ``stylesheets``)
         """
         try:
             # Handle template input
@@ -64,19 +118,18 @@ class HtmlConverter(BaseConverter):
     ) -> Path:
         """Convert from HTML to another format."""
         try:
-            from bs4 import BeautifulSoup
-            
             # Read the HTML content
             with open(source_path, 'r', encoding='utf-8') as f:
                 html_content = f.read()
             
-            # Parse HTML with BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
+            # Parse HTML with BeautifulSoup, only for the formats that need a tree
+            if to_format in ('epub', 'json') or (to_format == 'xml' and lxml_html is None):
+                from bs4 import BeautifulSoup
+                soup = BeautifulSoup(html_content, _HTML_PARSER)
             
             if to_format == 'pdf':
                 # Convert HTML to PDF using WeasyPrint
-                from weasyprint import HTML
-                HTML(string=html_content).write_pdf(output_path)
+                self.html_string_to_pdf(html_content, output_path, **kwargs)
                 
             elif to_format == 'docx':
                 # Convert HTML to DOCX using python-docx
@@ -97,7 +150,6 @@ class HtmlConverter(BaseConverter):
             elif to_format == 'epub':
                 # Convert HTML to EPUB using ebooklib
                 from ebooklib import epub
-                from bs4 import BeautifulSoup
                 
                 # Create a new EPUB book
                 book = epub.EpubBook()
@@ -132,23 +184,48 @@ class HtmlConverter(BaseConverter):
                 
             elif to_format == 'json':
                 # Convert HTML to JSON
-                import json
+                from bs4 import CData, NavigableString
+                from .json_converter import dump_json_bytes
+                
+                # Extract text content and metadata in one walk over the tree
+                title_tag = None
+                texts = []
+                links = []
+                images = []
+                for el in soup.descendants:
+                    el_type = type(el)
+                    if el_type is NavigableString or el_type is CData:
+                        text = el.strip()
+                        if text:
+                            texts.append(text)
+                    elif el.name == 'a':
+                        if 'href' in el.attrs:
+                            links.append(el['href'])
+                    elif el.name == 'img':
+                        if 'src' in el.attrs:
+                            images.append(el['src'])
+                    elif el.name == 'title' and title_tag is None:
+                        title_tag = el
                 
-                # Extract text content and metadata
                 result = {
-                    'title': soup.title.string if soup.title else None,
-                    'text': soup.get_text('\n', strip=True),
-                    'links': [a.get('href') for a in soup.find_all('a', href=True)],
-                    'images': [img.get('src') for img in soup.find_all('img', src=True)],
+                    'title': title_tag.string if title_tag is not None else None,
+                    'text': '\n'.join(texts),
+                    'links': links,
+                    'images': images,
                 }
                 
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(result, f, indent=2, ensure_ascii=False)
+                with open(output_path, 'wb') as f:
+                    f.write(dump_json_bytes(result))
                 
             elif to_format == 'xml':
                 # Convert HTML to well-formed XML
+                if lxml_html is not None:
+                    tree = lxml_html.fromstring(html_content)
+                    xml_content = etree.tostring(tree, method='xml', encoding='unicode')
+                else:
+                    xml_content = str(soup)
                 with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(str(soup))
+                    f.write(xml_content)
             
             return output_path
             
@@ -157,6 +234,37 @@ class HtmlConverter(BaseConverter):
         except Exception as e:
             raise ConversionError(f"Failed to convert HTML to {to_format}: {str(e)}") from e
     
+    def html_string_to_pdf(
+        self,
+        html_content: str,
+        output_path: Union[str, Path],
+        **kwargs
+    ) -> Path:
+        """Render an HTML string to PDF with WeasyPrint, without a temporary file.
+        
+        Args:
+            html_content: HTML document to render
+            output_path: PDF file to write
+            **kwargs: Rendering options
+                - stylesheets: CSS files to apply; each is parsed once per process
+                - strip_link_css: Remove ``<link rel="stylesheet">`` tags first
+            
+        Returns:
+            Path to the written PDF
+        """
+        from weasyprint import HTML
+        
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if kwargs.get('strip_link_css'):
+            html_content = _LINK_CSS_RE.sub('', html_content)
+        HTML(string=html_content).write_pdf(
+            output_path,
+            stylesheets=_get_stylesheets(kwargs.get('stylesheets') or ()),
+            font_config=_get_font_config()
+        )
+        return output_path
+    
     def _convert_to_html(
         self,
         source_path: Path,
@@ -176,18 +284,15 @@ class HtmlConverter(BaseConverter):
     ) -> Path:
         """Convert a template to HTML."""
         try:
-            from jinja2 import Environment, FileSystemLoader
-            import json
-            
             # Validate template
             if 'template' not in template:
                 raise ValueError("Template must contain a 'template' key")
             if 'data' not in template:
                 raise ValueError("Template must contain a 'data' key with template variables")
             
-            # Set up Jinja2 environment
+            # Set up Jinja2 environment (shared per template directory)
             template_path = Path(template['template']).parent
-            env = Environment(loader=FileSystemLoader(str(template_path)))
+            env = get_template_env(str(template_path.resolve()))
             
             # Load template
             template_name = Path(template['template']).name
@@ -1,11 +1,133 @@
 """JSON converter implementation for Redoc."""
 
 import json
+import mmap
+import os
+import re
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
+try:
+    from lxml import etree
+except ImportError:  # Optional: the stdlib builder writes the same XML
+    import xml.etree.ElementTree as etree
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON serialization
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # Optional: pysimdjson, faster JSON parsing
+    simdjson = None
+
 from . import register_converter, BaseConverter
 from ..exceptions import ConversionError
+from ..utils import get_template_env
+
+
+# Files at least this large are memory-mapped rather than read when orjson
+# can parse the mapping in place; below it the mmap setup costs more
+_MMAP_MIN_SIZE = 64 * 1024
+
+# Keys usable as XML element names as they are
+_XML_NAME_RE = re.compile(r'[A-Za-z_][\w.\-]*\Z')
+
+
+def _xml_tag(key: Any) -> Dict[str, str]:
+    """Map a dict key to an element tag, like dicttoxml does.
+    
+    Digit-only keys get an ``n`` prefix and spaces become underscores; keys
+    that are still not valid names become ``<key name="...">``.
+    """
+    name = str(key)
+    if name.isdigit():
+        name = f'n{name}'
+    name = name.replace(' ', '_')
+    if _XML_NAME_RE.match(name):
+        return {'tag': name}
+    return {'tag': 'key', 'attrib': {'name': str(key)}}
+
+
+def _dict_to_lxml(tag: str, value: Any, parent: Any = None, attrib: Optional[Dict[str, str]] = None) -> Any:
+    """Build an XML element tree from JSON data.
+    
+    Dicts become child elements per key, list entries become ``<item>``
+    elements, booleans are written as ``true``/``false`` and None as an
+    empty element.
+    """
+    if parent is None:
+        element = etree.Element(tag, attrib or {})
+    else:
+        element = etree.SubElement(parent, tag, attrib or {})
+    
+    if isinstance(value, dict):
+        for key, child in value.items():
+            _dict_to_lxml(parent=element, value=child, **_xml_tag(key))
+    elif isinstance(value, (list, tuple)):
+        for child in value:
+            _dict_to_lxml('item', child, element)
+    elif isinstance(value, bool):
+        element.text = 'true' if value else 'false'
+    elif value is not None:
+        element.text = str(value)
+    return element
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes into plain Python objects with the fastest parser available.
+    
+    simdjson and orjson reject some input the standard library accepts, such
+    as integers wider than 64 bits and ``NaN``/``Infinity``; on a decode
+    error the standard library parser gets the final word.
+    """
+    try:
+        if simdjson is not None:
+            return simdjson.loads(raw)
+        if orjson is not None:
+            return orjson.loads(raw)
+    except ValueError:
+        pass
+    return json.loads(raw)
+
+
+def dump_json_bytes(data: Any, indent: Optional[int] = 2, ensure_ascii: bool = False) -> bytes:
+    """Serialize ``data`` to UTF-8 JSON bytes in a single encode.
+    
+    Uses orjson when it supports the requested options (two-space or no
+    indent, non-ASCII left unescaped), and the standard library otherwise.
+    """
+    if orjson is not None and indent in (2, None) and not ensure_ascii:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            # e.g. integers wider than 64 bits; the stdlib handles those
+            pass
+    return json.dumps(data, indent=indent, ensure_ascii=ensure_ascii).encode('utf-8')
+
+
+def _load_json_file(path: Path) -> Any:
+    """Parse a JSON file, memory-mapping large files instead of reading them."""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if orjson is None or size < _MMAP_MIN_SIZE:
+            return _loads(f.read())
+        
+        # orjson parses straight from the page cache through a memoryview
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                try:
+                    return orjson.loads(view)
+                except ValueError:
+                    pass
+        
+        # Input orjson rejects (e.g. NaN, wide integers) goes through _loads
+        f.seek(0)
+        return _loads(f.read())
 
 
 @register_converter('json')
@@ -70,8 +192,7 @@ class JsonConverter(BaseConverter):
         """Convert from JSON to another format."""
         try:
             # Load JSON data
-            with open(source_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _load_json_file(source_path)
             
             if to_format == 'html':
                 # Convert JSON to HTML table
@@ -85,27 +206,21 @@ class JsonConverter(BaseConverter):
                 # Convert JSON to PDF via HTML
                 from .html_converter import HtmlConverter
                 html = self._json_to_html(data, **kwargs)
-                temp_html = output_path.with_suffix('.html')
-                with open(temp_html, 'w', encoding='utf-8') as f:
-                    f.write(html)
                 
-                # Use HTML to PDF conversion
-                html_converter = HtmlConverter()
-                html_converter.convert(temp_html, output_path, from_format='html', to_format='pdf')
-                temp_html.unlink()  # Clean up temporary file
+                # Render the HTML in memory; no temporary file
+                HtmlConverter().html_string_to_pdf(html, output_path, **kwargs)
                 
             elif to_format == 'xml':
                 # Convert JSON to XML
-                from dicttoxml import dicttoxml
-                from xml.dom.minidom import parseString
-                
-                xml = dicttoxml(data, custom_root='document', attr_type=False)
-                dom = parseString(xml)
-                pretty_xml = dom.toprettyxml()
+                root = _dict_to_lxml('document', data)
                 
                 output_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(pretty_xml)
+                tree = etree.ElementTree(root)
+                if hasattr(root, 'getroottree'):
+                    tree.write(str(output_path), pretty_print=True, xml_declaration=True, encoding='utf-8')
+                else:
+                    etree.indent(tree)
+                    tree.write(str(output_path), xml_declaration=True, encoding='utf-8')
                     
             elif to_format == 'yaml':
                 # Convert JSON to YAML
@@ -127,23 +242,22 @@ class JsonConverter(BaseConverter):
                         f.write("")
                     return output_path
                 
-                # Get fieldnames from the first object
-                fieldnames = set()
+                # One pass picks out the rows and gathers their keys; the
+                # header needs every key before the first row is written
+                rows = []
+                keys = set()
                 for item in data:
                     if isinstance(item, dict):
-                        fieldnames.update(item.keys())
-                
-                fieldnames = sorted(fieldnames)
+                        rows.append(item)
+                        keys.update(item)
+                fieldnames = sorted(keys)
                 
                 with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
+                    writer = csv.writer(f)
+                    writer.writerow(fieldnames)
                     
-                    for item in data:
-                        if isinstance(item, dict):
-                            # Ensure all fields are present
-                            row = {field: item.get(field, '') for field in fieldnames}
-                            writer.writerow(row)
+                    # Missing fields are written as empty cells
+                    writer.writerows([row.get(field, '') for field in fieldnames] for row in rows)
             
             return output_path
             
@@ -200,10 +314,7 @@ class JsonConverter(BaseConverter):
     
     def _json_to_html(self, data: Any, **kwargs) -> str:
         """Convert JSON data to an HTML representation."""
-        from jinja2 import Environment, PackageLoader
-        
-        env = Environment(loader=PackageLoader('redoc', 'templates'))
-        template = env.get_template('json_viewer.html')
+        template = get_template_env().get_template('json_viewer.html')
         
         return template.render(
             data=data,
@@ -219,11 +330,13 @@ class JsonConverter(BaseConverter):
     ) -> Path:
         """Save data as JSON to the specified path."""
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        indent = kwargs.get('indent', 2)
-        ensure_ascii = kwargs.get('ensure_ascii', False)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii)
+        encoded = dump_json_bytes(
+            data,
+            indent=kwargs.get('indent', 2),
+            ensure_ascii=kwargs.get('ensure_ascii', False)
+        )
+        with open(output_path, 'wb') as f:
+            f.write(encoded)
         
         return output_path
     
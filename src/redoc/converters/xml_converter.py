@@ -7,6 +7,7 @@ import xml.etree.ElementTree as ET
 
 from . import register_converter, BaseConverter
 from ..exceptions import ConversionError
+from ..utils import get_template_env
 
 
 @register_converter('xml')
@@ -279,13 +280,10 @@ class XmlConverter(BaseConverter):
     
     def _xml_to_html(self, root: ET.Element, **kwargs) -> str:
         """Convert XML to an HTML representation."""
-        from jinja2 import Environment, PackageLoader
-        
         # Convert XML to a dictionary for templating
         data = self._xml_to_dict(root)
         
-        env = Environment(loader=PackageLoader('redoc', 'templates'))
-        template = env.get_template('xml_viewer.html')
+        template = get_template_env().get_template('xml_viewer.html')
         
         return template.render(
             data=data,
@@ -1,9 +1,11 @@
 """PDF template handler with bidirectional document-data conversion."""
 
+import io
 import json
 import tempfile
+from html import escape
 from pathlib import Path
-from typing import Dict, Any, Optional, Type, Union
+from typing import BinaryIO, Dict, Any, Optional, Type, Union
 from dataclasses import dataclass, field
 from pydantic import BaseModel, Field
 
@@ -58,7 +60,24 @@ class PDFTemplateHandler(TemplateManager[PDFTemplateData]):
         """
         # First render HTML from template
         html_content = self.render_template(template_name, data)
+        return self.render_pdf_from_html(html_content, output_pdf, **kwargs)
+    
+    def render_pdf_from_html(
+        self,
+        html_content: str,
+        output_pdf: str,
+        **kwargs
+    ) -> str:
+        """Render a PDF from already rendered HTML.
         
+        Args:
+            html_content: Rendered HTML document
+            output_pdf: Path to save the generated PDF
+            **kwargs: Additional arguments for PDF conversion
+            
+        Returns:
+            Path to the generated PDF file
+        """
         # Save HTML to temp file
         with tempfile.NamedTemporaryFile(suffix='.html', delete=False, mode='w') as f:
             f.write(html_content)
@@ -90,35 +109,69 @@ class PDFTemplateHandler(TemplateManager[PDFTemplateData]):
             pdf_path: Path to the PDF file
             template_name: Optional template name to guide extraction
             **kwargs: Additional arguments for PDF processing
+                - password: Password for encrypted documents
             
         Returns:
             Extracted data as dictionary
         """
         try:
-            # First convert PDF to HTML
-            with tempfile.NamedTemporaryFile(suffix='.html', delete=False) as f:
-                temp_html = f.name
+            with open(pdf_path, 'rb') as f:
+                return self._extract_from_stream(f, str(pdf_path), template_name, **kwargs)
+        except TemplateError:
+            raise
+        except Exception as e:
+            raise TemplateError(f"Failed to extract data from PDF: {str(e)}") from e
+    
+    def extract_data_from_buffer(
+        self,
+        buffer: Union[bytes, bytearray, memoryview, BinaryIO],
+        source: Optional[str] = None,
+        template_name: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Extract structured data from a PDF held in memory.
+        
+        Accepts raw bytes or any seekable binary file-like object, including an
+        ``mmap.mmap`` of the file, which is read in place without copying it.
+        Returns the same structure as ``extract_data``.
+        
+        Args:
+            buffer: PDF content or a file-like object over it
+            source: Optional name of the document, stored in the metadata
+            template_name: Optional template name to guide extraction
+            **kwargs: Additional arguments for PDF processing
+                - password: Password for encrypted documents
             
-            self.pdf_converter.convert(
-                pdf_path,
-                temp_html,
-                from_format='pdf',
-                to_format='html',
-                **kwargs
-            )
+        Returns:
+            Extracted data as dictionary
+        """
+        stream = buffer if hasattr(buffer, 'read') else io.BytesIO(buffer)
+        return self._extract_from_stream(stream, source, template_name, **kwargs)
+    
+    def _extract_from_stream(
+        self,
+        stream: BinaryIO,
+        source: Optional[str],
+        template_name: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Extract data from a seekable PDF stream; shared by both entry points."""
+        try:
+            from PyPDF2 import PdfReader
             
-            # Read the HTML content
-            html_content = Path(temp_html).read_text(encoding='utf-8')
+            reader = PdfReader(stream, password=kwargs.get('password'))
+            pages = [page.extract_text() or "" for page in reader.pages]
             
-            # Here you would parse the HTML and extract structured data
-            # This is a simplified example - you might want to use BeautifulSoup
-            # or another HTML parser for more complex documents
+            # Here you would map the content onto the fields of ``template_name``.
+            # For now, return the page content in a structured format.
+            html_content = "".join(
+                f'<div class="page">{escape(text)}</div>\n' for text in pages
+            )
             
-            # For now, just return the HTML content in a structured format
             return {
                 "metadata": {
-                    "source": pdf_path,
-                    "pages": self._count_pdf_pages(pdf_path)
+                    "source": source,
+                    "pages": len(pages)
                 },
                 "content": {
                     "html": html_content,
@@ -128,18 +181,6 @@ class PDFTemplateHandler(TemplateManager[PDFTemplateData]):
             
         except Exception as e:
             raise TemplateError(f"Failed to extract data from PDF: {str(e)}") from e
-        finally:
-            # Clean up temp file
-            Path(temp_html).unlink(missing_ok=True)
-    
-    def _count_pdf_pages(self, pdf_path: str) -> int:
-        """Count the number of pages in a PDF file."""
-        try:
-            # This is a placeholder - you might want to use PyPDF2 or similar
-            # for more accurate page counting
-            return 1
-        except Exception:
-            return 0
     
     def _extract_text_from_html(self, html_content: str) -> str:
         """Extract plain text from HTML content."""
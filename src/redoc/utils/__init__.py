@@ -1,5 +1,6 @@
 """Utility functions for the Redoc package."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 import mimetypes
@@ -123,3 +124,46 @@ def ensure_directory_exists(path: Union[str, Path]) -> Path:
     path = Path(path).resolve()
     path.parent.mkdir(parents=True, exist_ok=True)
     return path
+
+
+def ensure_dir(path: Union[str, Path]) -> Path:
+    """Create a directory (and parents) if it does not exist.
+    
+    Args:
+        path: Directory path
+        
+    Returns:
+        Path object for the directory
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@lru_cache(maxsize=32)
+def get_template_env(template_dir: Optional[str] = None) -> Any:
+    """Return a shared Jinja2 environment for a template directory.
+    
+    Environments are created once per directory and keep their compiled
+    templates in memory; compiled bytecode is also cached on disk so new
+    processes skip compilation. A template edited on disk is recompiled on
+    its next use.
+    
+    Args:
+        template_dir: Directory to load templates from, or None for the
+            templates bundled with Redoc
+        
+    Returns:
+        jinja2.Environment for the directory
+    """
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, PackageLoader
+    
+    if template_dir is None:
+        loader = PackageLoader('redoc', 'templates')
+    else:
+        loader = FileSystemLoader(template_dir)
+    return Environment(
+        loader=loader,
+        bytecode_cache=FileSystemBytecodeCache(),
+        auto_reload=True
+    )
@@ -0,0 +1,42 @@
+"""Tests for the converter registry."""
+import pytest
+
+from redoc import converters
+from redoc.converters import BaseConverter, get_converter, register_converter
+from redoc.exceptions import UnsupportedFormatError
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Isolate registrations made by a test from the shared registry."""
+    monkeypatch.setattr(converters, '_CONVERTERS', dict(converters._CONVERTERS))
+    monkeypatch.setattr(converters, '_INSTANCES', {})
+
+
+class _DummyConverter(BaseConverter):
+    def convert(self, source, output_file=None, **kwargs):
+        return output_file
+
+
+def test_get_converter_reuses_instance(registry):
+    register_converter('dummy')(_DummyConverter)
+
+    converter = get_converter('dummy')
+
+    assert isinstance(converter, _DummyConverter)
+    assert get_converter('dummy') is converter
+    assert get_converter('DUMMY') is converter
+
+
+def test_register_converter_replaces_cached_instance(registry):
+    register_converter('dummy')(_DummyConverter)
+    first = get_converter('dummy')
+
+    register_converter('dummy')(_DummyConverter)
+
+    assert get_converter('dummy') is not first
+
+
+def test_get_converter_unknown_format(registry):
+    with pytest.raises(UnsupportedFormatError):
+        get_converter('no-such-format')
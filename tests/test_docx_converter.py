@@ -0,0 +1,200 @@
+"""Tests for reading DOCX documents with DocxConverter."""
+import zipfile
+
+import pytest
+
+from redoc.converters import docx_converter
+from redoc.converters.docx_converter import DocxConverter
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+DOCUMENT_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{W_NS}"
+            xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006">
+  <w:body>
+    <w:p>
+      <w:pPr>
+        <w:pStyle w:val="Heading1"/>
+        <w:tabs><w:tab w:val="left" w:pos="720"/><w:tab w:val="right" w:pos="9000"/></w:tabs>
+      </w:pPr>
+      <w:r><w:t>Title</w:t></w:r>
+    </w:p>
+    <w:p>
+      <w:r><w:t>Name</w:t><w:tab/><w:t xml:space="preserve">Value &lt;1&gt;</w:t></w:r>
+      <w:hyperlink><w:r><w:t xml:space="preserve"> link</w:t></w:r></w:hyperlink>
+    </w:p>
+    <w:p>
+      <w:r>
+        <w:t>Before box</w:t>
+        <mc:AlternateContent>
+          <mc:Choice Requires="wps"><w:p><w:r><w:t>Box text</w:t></w:r></w:p></mc:Choice>
+          <mc:Fallback><w:p><w:r><w:t>Box text</w:t></w:r></w:p></mc:Fallback>
+        </mc:AlternateContent>
+      </w:r>
+    </w:p>
+    <w:tbl>
+      <w:tr>
+        <w:tc><w:p><w:r><w:t>Col A</w:t></w:r></w:p></w:tc>
+        <w:tc><w:p><w:r><w:t>Col B</w:t></w:r></w:p></w:tc>
+      </w:tr>
+      <w:tr>
+        <w:tc><w:p><w:r><w:t>1</w:t></w:r></w:p></w:tc>
+        <w:tc><w:p><w:r><w:t>a|b</w:t></w:r></w:p></w:tc>
+      </w:tr>
+    </w:tbl>
+    <w:p>
+      <w:pPr><w:pStyle w:val="Heading2"/></w:pPr>
+      <w:r><w:t>After table</w:t></w:r>
+    </w:p>
+  </w:body>
+</w:document>
+"""
+
+LOCALIZED_STYLES_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:styles xmlns:w="{W_NS}">
+  <w:style w:type="paragraph" w:default="1" w:styleId="Standard"><w:name w:val="Normal"/></w:style>
+  <w:style w:type="paragraph" w:styleId="berschrift1"><w:name w:val="heading 1"/></w:style>
+  <w:style w:type="paragraph" w:styleId="Titre2"><w:name w:val="heading 2"/></w:style>
+  <w:style w:type="paragraph" w:styleId="Kapitel">
+    <w:name w:val="Kapitel"/><w:basedOn w:val="berschrift1"/>
+  </w:style>
+  <w:style w:type="paragraph" w:styleId="Gliederung">
+    <w:name w:val="Gliederung"/><w:pPr><w:outlineLvl w:val="2"/></w:pPr>
+  </w:style>
+</w:styles>
+"""
+
+LOCALIZED_DOCUMENT_XML = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{W_NS}">
+  <w:body>
+    <w:p><w:pPr><w:pStyle w:val="berschrift1"/></w:pPr><w:r><w:t>Eins</w:t></w:r></w:p>
+    <w:p><w:pPr><w:pStyle w:val="Titre2"/></w:pPr><w:r><w:t>Deux</w:t></w:r></w:p>
+    <w:p><w:pPr><w:pStyle w:val="Kapitel"/></w:pPr><w:r><w:t>Kapitel</w:t></w:r></w:p>
+    <w:p><w:pPr><w:pStyle w:val="Gliederung"/></w:pPr><w:r><w:t>Drei</w:t></w:r></w:p>
+    <w:p><w:pPr><w:outlineLvl w:val="1"/></w:pPr><w:r><w:t>Direct</w:t></w:r></w:p>
+    <w:p>
+      <w:pPr><w:pStyle w:val="berschrift1"/><w:outlineLvl w:val="9"/></w:pPr>
+      <w:r><w:t>Body</w:t></w:r>
+    </w:p>
+    <w:p><w:pPr><w:pStyle w:val="Standard"/></w:pPr><w:r><w:t>Text</w:t></w:r></w:p>
+  </w:body>
+</w:document>
+"""
+
+
+@pytest.fixture(autouse=True)
+def no_libreoffice_prewarm(monkeypatch):
+    """Keep the converter from starting LibreOffice in the background."""
+    monkeypatch.setenv('REDOC_NO_LO_PREWARM', '1')
+
+
+@pytest.fixture(params=['tree', 'iterparse'])
+def sample_docx(request, tmp_path, monkeypatch):
+    """A small DOCX file, read both as a whole tree and incrementally."""
+    if request.param == 'iterparse':
+        monkeypatch.setattr(docx_converter, '_DOCX_TREE_PARSE_LIMIT', 0)
+    path = tmp_path / 'sample.docx'
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('word/document.xml', DOCUMENT_XML)
+    return path
+
+
+def test_blocks_in_document_order(sample_docx):
+    blocks = list(docx_converter._iter_docx_blocks(sample_docx))
+
+    assert [block[0] for block in blocks] == ['p', 'p', 'p', 'tbl', 'p']
+    assert blocks[0] == ('p', 1, 'Title')
+    assert blocks[3] == ('tbl', [['Col A', 'Col B'], ['1', 'a|b']])
+    assert blocks[4] == ('p', 2, 'After table')
+
+
+def test_paragraph_text_ignores_tab_stops_and_textboxes(sample_docx):
+    blocks = list(docx_converter._iter_docx_blocks(sample_docx))
+
+    assert blocks[0][2] == 'Title'
+    assert blocks[1][2] == 'Name\tValue <1> link'
+    assert blocks[2][2] == 'Before box'
+
+
+def test_docx_to_html(sample_docx, tmp_path):
+    output = DocxConverter().convert(sample_docx, tmp_path / 'out.html')
+    html = output.read_text(encoding='utf-8')
+
+    assert '<h1>Title</h1>' in html
+    assert '<p>Name\tValue &lt;1&gt; link</p>' in html
+    assert '<h2>After table</h2>' in html
+    assert '<thead><tr><th>Col A</th><th>Col B</th></tr></thead>' in html
+    assert html.index('<table>') < html.index('<h2>After table</h2>')
+
+
+def test_docx_to_markdown(sample_docx, tmp_path):
+    output = DocxConverter().convert(sample_docx, tmp_path / 'out.md')
+
+    assert output.read_text(encoding='utf-8') == (
+        '# Title\n\n'
+        'Name\tValue <1> link\n\n'
+        'Before box\n\n'
+        '| Col A | Col B |\n'
+        '| --- | --- |\n'
+        '| 1 | a\\|b |\n\n'
+        '## After table\n'
+    )
+
+
+def test_docx_to_text(sample_docx, tmp_path):
+    output = DocxConverter().convert(sample_docx, tmp_path / 'out.txt')
+
+    assert output.read_text(encoding='utf-8').splitlines() == [
+        'Title',
+        'Name\tValue <1> link',
+        'Before box',
+        'Col A\tCol B',
+        '1\ta|b',
+        '',
+        'After table',
+    ]
+
+
+def test_iterparse_detaches_blocks_from_large_body(tmp_path, monkeypatch):
+    pytest.importorskip('lxml')
+    monkeypatch.setattr(docx_converter, '_DOCX_TREE_PARSE_LIMIT', 0)
+    paragraphs = ''.join(f'<w:p><w:r><w:t>Line {i}</w:t></w:r></w:p>' for i in range(5000))
+    path = tmp_path / 'large.docx'
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr(
+            'word/document.xml',
+            f'<w:document xmlns:w="{W_NS}"><w:body>{paragraphs}</w:body></w:document>'
+        )
+
+    # Record how many earlier blocks are still attached at each paragraph
+    earlier = []
+    paragraph_level = docx_converter._paragraph_level
+
+    def spy(p, levels):
+        earlier.append(sum(1 for _ in p.itersiblings(preceding=True)))
+        return paragraph_level(p, levels)
+
+    monkeypatch.setattr(docx_converter, '_paragraph_level', spy)
+    blocks = list(docx_converter._iter_docx_blocks(path))
+
+    assert [block[2] for block in blocks] == [f'Line {i}' for i in range(5000)]
+    assert max(earlier) <= 1
+
+
+def test_localized_heading_styles(tmp_path):
+    path = tmp_path / 'localized.docx'
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('word/document.xml', LOCALIZED_DOCUMENT_XML)
+        archive.writestr('word/styles.xml', LOCALIZED_STYLES_XML)
+
+    output = DocxConverter().convert(path, tmp_path / 'out.md')
+
+    assert output.read_text(encoding='utf-8') == (
+        '# Eins\n\n'
+        '## Deux\n\n'
+        '# Kapitel\n\n'
+        '### Drei\n\n'
+        '## Direct\n\n'
+        'Body\n\n'
+        'Text\n'
+    )
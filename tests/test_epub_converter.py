@@ -0,0 +1,193 @@
+"""Tests for EPUB text and table of contents extraction in EpubConverter."""
+import zipfile
+
+import pytest
+
+from redoc.converters import epub_converter
+from redoc.converters.epub_converter import EpubConverter
+
+CONTAINER_XML = """<?xml version="1.0"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>
+"""
+
+CONTENT_OPF = """<?xml version="1.0" encoding="UTF-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="id">
+  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+    <dc:identifier id="id">test-book</dc:identifier>
+    <dc:title>Test Book</dc:title>
+  </metadata>
+  <manifest>
+    <item id="ch2" href="text/chapter%202.xhtml" media-type="application/xhtml+xml"/>
+    <item id="ch1" href="text/chapter1.xhtml" media-type="application/xhtml+xml"/>
+    <item id="css" href="style.css" media-type="text/css"/>
+  </manifest>
+  <spine>
+    <itemref idref="ch1"/>
+    <itemref idref="ch2"/>
+  </spine>
+</package>
+"""
+
+CHAPTER_1 = """<?xml version="1.0" encoding="UTF-8"?>
+<html xmlns="http://www.w3.org/1999/xhtml">
+<head><title>One</title><style>p { color: red; }</style></head>
+<body>
+  <h1>Chapter One</h1>
+  <!-- editor note -->
+  <p>First paragraph.</p>
+  <script>var hidden = 1;</script>
+  <p>Second paragraph.</p>
+</body>
+</html>
+"""
+
+CHAPTER_2 = """<?xml version="1.0" encoding="UTF-8"?>
+<html xmlns="http://www.w3.org/1999/xhtml">
+<head><title>Two</title></head>
+<body><h1>Chapter Two</h1><p>Last words.</p></body>
+</html>
+"""
+
+
+@pytest.fixture
+def sample_epub(tmp_path):
+    """A minimal EPUB whose manifest order differs from its spine order."""
+    path = tmp_path / 'book.epub'
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('mimetype', 'application/epub+zip', compress_type=zipfile.ZIP_STORED)
+        archive.writestr('META-INF/container.xml', CONTAINER_XML)
+        archive.writestr('OEBPS/content.opf', CONTENT_OPF)
+        archive.writestr('OEBPS/text/chapter1.xhtml', CHAPTER_1)
+        archive.writestr('OEBPS/text/chapter 2.xhtml', CHAPTER_2)
+        archive.writestr('OEBPS/style.css', 'body { margin: 0; }')
+    return path
+
+
+def test_extract_text_fast_follows_spine(sample_epub):
+    pytest.importorskip('lxml')
+
+    texts = epub_converter._extract_text_fast(sample_epub)
+
+    assert texts == [
+        'One\nChapter One\nFirst paragraph.\nSecond paragraph.',
+        'Two\nChapter Two\nLast words.',
+    ]
+
+
+def test_extract_text_fast_reads_bytes(sample_epub):
+    pytest.importorskip('lxml')
+
+    assert epub_converter._extract_text_fast(sample_epub.read_bytes()) == (
+        epub_converter._extract_text_fast(sample_epub)
+    )
+
+
+def test_extract_text_fast_rejects_other_layouts(tmp_path):
+    pytest.importorskip('lxml')
+    path = tmp_path / 'broken.epub'
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('mimetype', 'application/epub+zip')
+
+    assert epub_converter._extract_text_fast(path) is None
+
+
+def test_epub_to_text(sample_epub, tmp_path):
+    pytest.importorskip('lxml')
+
+    output = EpubConverter().convert(sample_epub, tmp_path / 'book.txt')
+
+    text = output.read_text(encoding='utf-8')
+    assert text.index('Chapter One') < text.index('Chapter Two')
+    assert 'hidden' not in text
+    assert 'color' not in text
+    assert 'editor note' not in text
+
+
+@pytest.fixture
+def nested_toc_book(tmp_path):
+    """An EPUB written through _write_book with a nested table of contents."""
+    epub = pytest.importorskip('ebooklib.epub')
+    book = epub.EpubBook()
+    book.set_identifier('toc-test')
+    book.set_title('TOC & Test')
+    book.set_language('en')
+
+    chapters = []
+    for i in range(1, 4):
+        chapter = epub.EpubHtml(title=f'Chapter {i}', file_name=f'ch{i}.xhtml', lang='en')
+        chapter.content = f'<h1>Chapter {i}</h1><p>Text {i}.</p>'
+        book.add_item(chapter)
+        chapters.append(chapter)
+    book.add_item(epub.EpubItem(
+        uid='cover', file_name='images/cover.png', media_type='image/png', content=b'\x89PNG' * 64
+    ))
+    book.toc = [
+        epub.Link('ch1.xhtml', 'Chapter 1 <intro>', 'ch1'),
+        (epub.Section('Part Two'), [
+            epub.Link('ch2.xhtml', 'Chapter 2', 'ch2'),
+            epub.Link('ch3.xhtml', 'Chapter 3', 'ch3'),
+        ]),
+    ]
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    book.spine = ['nav', *chapters]
+
+    path = tmp_path / 'toc.epub'
+    epub_converter._write_book(book, path)
+    return path
+
+
+def test_write_book_stores_media_uncompressed(nested_toc_book):
+    with zipfile.ZipFile(nested_toc_book) as archive:
+        compression = {info.filename: info.compress_type for info in archive.infolist()}
+
+    assert compression['mimetype'] == zipfile.ZIP_STORED
+    assert compression['EPUB/images/cover.png'] == zipfile.ZIP_STORED
+    assert compression['EPUB/ch1.xhtml'] == zipfile.ZIP_DEFLATED
+
+
+def test_ncx_toc(nested_toc_book):
+    pytest.importorskip('lxml')
+    from ebooklib import epub
+
+    book = epub.read_epub(str(nested_toc_book))
+    buf = []
+
+    assert EpubConverter()._render_ncx_toc(book, buf)
+    assert buf == [
+        '<li><a href="#ch1.xhtml">Chapter 1 &lt;intro&gt;</a>',
+        '</li>',
+        '<li><a href="#ch2.xhtml">Part Two</a>',
+        '<ul>',
+        '<li><a href="#ch2.xhtml">Chapter 2</a>',
+        '</li>',
+        '<li><a href="#ch3.xhtml">Chapter 3</a>',
+        '</li>',
+        '</ul>',
+        '</li>',
+    ]
+
+
+def test_epub_to_html_includes_toc(nested_toc_book, tmp_path):
+    pytest.importorskip('bs4')
+
+    output = EpubConverter().convert(nested_toc_book, tmp_path / 'toc.html')
+
+    markup = output.read_text(encoding='utf-8')
+    assert '<div class="toc">' in markup
+    assert markup.index('Part Two') < markup.index('<h1>Chapter 2</h1>')
+
+
+def test_subclass_overrides_epub_handler(sample_epub, tmp_path):
+    class TextOverrideConverter(EpubConverter):
+        def _epub_to_text(self, source_path, output_path, **kwargs):
+            output_path.write_text('OVERRIDDEN', encoding='utf-8')
+            return output_path
+
+    output = TextOverrideConverter().convert(sample_epub, tmp_path / 'book.txt')
+
+    assert output.read_text(encoding='utf-8') == 'OVERRIDDEN'
@@ -0,0 +1,50 @@
+"""Tests for HTML to XML and JSON output of HtmlConverter."""
+import json
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from redoc.converters.html_converter import HtmlConverter
+
+PAGE_HTML = """<!DOCTYPE html>
+<html>
+<head><title>Sample Page</title></head>
+<body>
+  <h1>Heading</h1>
+  <p>Intro with <a href="https://example.com/">a link</a>.<br>
+  Next line</p>
+  <img src="logo.png" alt="Logo">
+  <a name="anchor">No href</a>
+</body>
+</html>
+"""
+
+
+@pytest.fixture
+def sample_html(tmp_path):
+    """An HTML page with void elements, links and images."""
+    path = tmp_path / 'page.html'
+    path.write_text(PAGE_HTML, encoding='utf-8')
+    return path
+
+
+def test_html_to_xml_is_well_formed(sample_html, tmp_path):
+    output = HtmlConverter().convert(sample_html, tmp_path / 'page.xml')
+
+    root = ET.parse(output).getroot()
+    assert root.tag == 'html'
+    assert root.find('head/title').text == 'Sample Page'
+    assert root.find('body/h1').text == 'Heading'
+    assert root.find('body/img').get('src') == 'logo.png'
+
+
+def test_html_to_json(sample_html, tmp_path):
+    output = HtmlConverter().convert(sample_html, tmp_path / 'page.json')
+
+    data = json.loads(output.read_text(encoding='utf-8'))
+    assert data['title'] == 'Sample Page'
+    assert data['text'].splitlines() == [
+        'Sample Page', 'Heading', 'Intro with', 'a link', '.', 'Next line', 'No href'
+    ]
+    assert data['links'] == ['https://example.com/']
+    assert data['images'] == ['logo.png']
@@ -0,0 +1,100 @@
+"""Tests for JSON parsing and XML and CSV output of JsonConverter."""
+import csv
+import json
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from redoc.converters import json_converter
+from redoc.converters.json_converter import JsonConverter
+
+
+@pytest.fixture
+def write_json(tmp_path):
+    """Write data to a JSON file and return its path."""
+    def write(data, name='data.json'):
+        path = tmp_path / name
+        path.write_text(json.dumps(data), encoding='utf-8')
+        return path
+    return write
+
+
+@pytest.mark.parametrize('key, expected', [
+    ('title', {'tag': 'title'}),
+    ('first name', {'tag': 'first_name'}),
+    ('2024', {'tag': 'n2024'}),
+    (7, {'tag': 'n7'}),
+    ('a/b', {'tag': 'key', 'attrib': {'name': 'a/b'}}),
+    ('-x', {'tag': 'key', 'attrib': {'name': '-x'}}),
+])
+def test_xml_tag(key, expected):
+    assert json_converter._xml_tag(key) == expected
+
+
+def test_json_to_xml(write_json, tmp_path):
+    source = write_json({
+        'title': 'Report',
+        'first name': 'Ada',
+        '2024': 1,
+        'a/b': 'slash',
+        'tags': ['x', 'y'],
+        'flags': {'done': True, 'draft': False},
+        'missing': None,
+    })
+    output = JsonConverter().convert(source, tmp_path / 'out.xml')
+
+    root = ET.parse(output).getroot()
+    assert root.tag == 'document'
+    assert [child.tag for child in root] == [
+        'title', 'first_name', 'n2024', 'key', 'tags', 'flags', 'missing'
+    ]
+    assert root.find('title').text == 'Report'
+    assert root.find('n2024').text == '1'
+    assert root.find('key').get('name') == 'a/b'
+    assert root.find('key').text == 'slash'
+    assert [item.text for item in root.find('tags')] == ['x', 'y']
+    assert root.find('flags/done').text == 'true'
+    assert root.find('flags/draft').text == 'false'
+    assert root.find('missing').text is None
+
+
+def test_json_to_csv_sorts_columns(write_json, tmp_path):
+    source = write_json([
+        {'name': 'a', 'id': 1},
+        {'zeta': True, 'name': 'b'},
+        'not a row',
+    ])
+    output = JsonConverter().convert(source, tmp_path / 'out.csv')
+
+    with open(output, newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    assert rows == [
+        ['id', 'name', 'zeta'],
+        ['1', 'a', ''],
+        ['', 'b', 'True'],
+    ]
+
+
+def test_json_to_csv_single_object(write_json, tmp_path):
+    source = write_json({'b': 2, 'a': 1})
+    output = JsonConverter().convert(source, tmp_path / 'out.csv')
+
+    assert output.read_text(encoding='utf-8').splitlines() == ['a,b', '1,2']
+
+
+def test_loads_accepts_what_the_stdlib_accepts():
+    data = json_converter._loads(b'{"big": 123456789012345678901234567890, "nan": NaN}')
+
+    assert data['big'] == 123456789012345678901234567890
+    assert data['nan'] != data['nan']
+
+
+def test_load_large_file_accepts_what_the_stdlib_accepts(tmp_path):
+    path = tmp_path / 'large.json'
+    padding = 'x' * json_converter._MMAP_MIN_SIZE
+    path.write_text(f'{{"nan": NaN, "padding": "{padding}"}}', encoding='utf-8')
+
+    data = json_converter._load_json_file(path)
+
+    assert data['nan'] != data['nan']
+    assert data['padding'] == padding